@@ -1,11 +1,21 @@
 import threading
 import time
 from Rengar import Rengar
+from LCUEvents import get_event_client, READY_CHECK_EVENT
+from Scheduler import get_scheduler
+from Metrics import LatencyTracker
+
+# O ready check fica aberto por ~10 s
+ACCEPT_WINDOW = 10.0
+RETRY_DELAY = 0.25
 
 class autoaccept:
     def __init__(self):
         self.auto_accept_enabled = False
         self.rengar = Rengar()
+        self.latency = LatencyTracker()
+        self._lock = threading.Lock()
+        self._accepting = False
 
     def toggle_auto_accept(self):
         self.auto_accept_enabled = not self.auto_accept_enabled
@@ -13,21 +23,97 @@ class autoaccept:
         print(f"Auto accept is now {state}.")
 
     def accept_match(self):
-        response = self.rengar.lcu_request("POST", f"/lol-matchmaking/v1/ready-check/accept", "")
+        """Envia o aceite, True se o cliente respondeu com sucesso"""
+        with self.latency.span("accept_request"):
+            response = self.rengar.lcu_request("POST", "/lol-matchmaking/v1/ready-check/accept", "")
+        return response.status_code in (200, 204)
+
+    def get_ready_check(self):
+        """Estado atual do ready check, None se não houver um"""
+        response = self.rengar.lcu_request("GET", "/lol-matchmaking/v1/ready-check", "")
+        if response.status_code != 200:
+            return None
+        return response.json()
+
+    def should_accept(self, ready_check):
+        return (self.auto_accept_enabled and bool(ready_check)
+                and ready_check.get("state") == "InProgress"
+                and ready_check.get("playerResponse") == "None")
+
+    def handle_ready_check(self, ready_check, detected=None):
+        """Aceita e confirma o playerResponse, tentando de novo até a janela do ready check fechar"""
+        if not self.should_accept(ready_check):
+            return False
+
+        # Evento e polling podem ver o mesmo ready check, só um aceita
+        with self._lock:
+            if self._accepting:
+                return False
+            self._accepting = True
+
+        detected = detected or time.perf_counter()
+        # "timer" é há quantos segundos o ready check está aberto
+        deadline = detected + ACCEPT_WINDOW - float(ready_check.get("timer") or 0)
+
+        try:
+            while True:
+                if self.accept_match():
+                    # Medido quando o aceite foi respondido, a confirmação é uma etapa à parte
+                    accepted = time.perf_counter()
+                    with self.latency.span("confirm"):
+                        current = self.get_ready_check()
+                    # Sem ready check depois do aceite = todos aceitaram e a fila andou
+                    if current is None or current.get("playerResponse") == "Accepted":
+                        self.latency.record("detect_to_accept", (accepted - detected) * 1000)
+                        if ready_check.get("timer") is not None:
+                            # Timer do ready check visto na detecção mais o tempo até o aceite
+                            pop_to_accept = float(ready_check["timer"]) + (accepted - detected)
+                            self.latency.record("pop_to_accept", pop_to_accept * 1000)
+                        return True
+                    if current.get("state") != "InProgress" or current.get("playerResponse") != "None":
+                        return False
+
+                if time.perf_counter() + RETRY_DELAY >= deadline:
+                    return False
+                time.sleep(RETRY_DELAY)
+        finally:
+            with self._lock:
+                self._accepting = False
+
+    def on_ready_check(self, payload):
+        # Evento empurrado pelo cliente, aceita assim que o ready check aparece
+        data = payload.get("data") or {}
+        if self.should_accept(data):
+            # Não segura a thread de eventos durante as novas tentativas
+            threading.Thread(
+                target=self.handle_ready_check,
+                args=(data, time.perf_counter()),
+                daemon=True,
+                name="AutoAccept",
+            ).start()
+
+    def get_latency_stats(self):
+        return self.latency.report()
 
     def monitor_queue(self):
+        events = get_event_client()
+        events.subscribe(READY_CHECK_EVENT, self.on_ready_check)
+        scheduler = get_scheduler()
+
         while True:
-            if self.auto_accept_enabled:
-                # Faz a requisição para verificar o estado da busca por partida
-                response = self.rengar.lcu_request("GET", "/lol-lobby/v2/lobby/matchmaking/search-state", "")
-                
-                if response.status_code == 200:
-                    match_data = response.json()
-                    #print(match_data)
-                    # Exibe o conteúdo da resposta para verificar o estado do matchmaking
-                    #print("Matchmaking Data:", match_data)
-
-                    if match_data.get("searchState") == "Found":
-                        self.accept_match()  # Não há um ID de partida, basta aceitar
-            
-            time.sleep(0.5)
\ No newline at end of file
+            # Com o socket de eventos conectado não é preciso fazer polling
+            if not self.auto_accept_enabled or events.is_connected():
+                time.sleep(scheduler.intervals.idle)
+                continue
+
+            # Dorme até o cliente entrar no ready check, sem polling fora dele
+            if scheduler.gameflow.wait_for(("ReadyCheck",), timeout=scheduler.intervals.idle) != "ReadyCheck":
+                continue
+
+            # Consulta o ready check direto, o search-state só diz que a partida foi encontrada
+            ready_check = self.get_ready_check()
+            if ready_check is not None:
+                self.handle_ready_check(ready_check)
+
+            # Intervalo depende da fase: rápido no ready check, lento fora da fila
+            time.sleep(scheduler.ready_check_interval())
@@ -1,5 +1,10 @@
+import re
+import time
+import unicodedata
+
 import requests
-from Rengar import Rengar
+from Rengar import Rengar, credentials
+from Cache import load_snapshot, save_snapshot
 from termcolor import colored
 
 rengar = Rengar()
@@ -12,83 +17,270 @@ class Champ:
         self.skins = []
 
 
-def fetch_all_champion_skins():
-    """Fetch all champion skins from Community Dragon"""
-    url = "https://raw.communitydragon.org/latest/plugins/rcp-be-lol-game-data/global/default/v1/skins.json"
-    
-    try:
-        response = requests.get(url, timeout=10)
-        
-        if response.status_code != 200:
-            print(colored("Error while searching skins.", "red"))
-            return None
-        
-        skins_data = response.json()
-        champs = {}
+SKINS_URL = "https://raw.communitydragon.org/latest/plugins/rcp-be-lol-game-data/global/default/v1/skins.json"
+SKINS_CACHE = "skins"
+# Bump when parse_skins output changes
+SKINS_CACHE_VERSION = 1
+# A warm cache from the current patch is trusted this long before asking Community Dragon again
+REVALIDATE_INTERVAL = 6 * 60 * 60
+
+_catalog = None
+# (client credentials, game version) of the client the patch was last read from
+_client_patch = None
 
-        for skin_id, current_skin in skins_data.items():
-            load_screen_path = current_skin.get("loadScreenPath", "")
+
+def get_client_patch():
+    """Game version of the running client, read once per client session, None without a client"""
+    global _client_patch
+
+    identity = credentials.league()
+    if None in identity:
+        return None
+    if _client_patch is None or _client_patch[0] != identity:
+        version = None
+        try:
+            rengar.update_league_credentials()
+            response = rengar.lcu_request("GET", "/lol-patch/v1/game-version", "")
+            if response.status_code == 200:
+                version = response.json()
+        except Exception:
+            pass
+        _client_patch = (identity, version)
+    return _client_patch[1]
+
+
+def parse_skins(skins_data):
+    """Group the Community Dragon skins.json entries by champion"""
+    champs = {}
+
+    for skin_id, current_skin in skins_data.items():
+        load_screen_path = current_skin.get("loadScreenPath", "")
+        
+        if "ASSETS/Characters/" not in load_screen_path:
+            continue
             
-            if "ASSETS/Characters/" not in load_screen_path:
-                continue
-                
-            name_start = load_screen_path.find("ASSETS/Characters/") + len("ASSETS/Characters/")
-            champ_name = load_screen_path[name_start:load_screen_path.find('/', name_start)]
+        name_start = load_screen_path.find("ASSETS/Characters/") + len("ASSETS/Characters/")
+        champ_name = load_screen_path[name_start:load_screen_path.find('/', name_start)]
 
-            name = current_skin.get("name", "")
-            skin = {}
+        name = current_skin.get("name", "")
+        skin = {}
 
-            if current_skin.get("isBase", False):
-                if champ_name not in champs:
-                    champs[champ_name] = Champ(name=champ_name)
-                
-                champ_key = skin_id
-                if champ_key.endswith("000"):
-                    champ_key = champ_key[:-3]
+        if current_skin.get("isBase", False):
+            if champ_name not in champs:
+                champs[champ_name] = Champ(name=champ_name)
+            
+            champ_key = skin_id
+            if champ_key.endswith("000"):
+                champ_key = champ_key[:-3]
+            
+            champs[champ_name].key = int(champ_key)
+            skin["id"] = skin_id
+            skin["name"] = "default"
+            champs[champ_name].skins.insert(0, skin)
+        else:
+            if champ_name not in champs:
+                champs[champ_name] = Champ(name=champ_name)
                 
-                champs[champ_name].key = int(champ_key)
-                skin["id"] = skin_id
-                skin["name"] = "default"
-                champs[champ_name].skins.insert(0, skin)
-            else:
-                if champ_name not in champs:
-                    champs[champ_name] = Champ(name=champ_name)
-                    
-                if current_skin.get("questSkinInfo"):
-                    skin_tiers = current_skin["questSkinInfo"].get("tiers", [])
-                    for skin_tier in skin_tiers:
-                        skin["id"] = skin_tier.get("id", "")
-                        skin["name"] = skin_tier.get("name", "")
-                        champs[champ_name].skins.append(skin.copy())
-                else:
-                    skin["id"] = skin_id
-                    skin["name"] = name
+            if current_skin.get("questSkinInfo"):
+                skin_tiers = current_skin["questSkinInfo"].get("tiers", [])
+                for skin_tier in skin_tiers:
+                    skin["id"] = skin_tier.get("id", "")
+                    skin["name"] = skin_tier.get("name", "")
                     champs[champ_name].skins.append(skin.copy())
+            else:
+                skin["id"] = skin_id
+                skin["name"] = name
+                champs[champ_name].skins.append(skin.copy())
+
+    return champs
+
+
+def _load_cached_catalog():
+    # Kept whatever the patch, an old catalog still beats none when offline
+    snapshot = load_snapshot(SKINS_CACHE)
+    if snapshot is None or not isinstance(snapshot["version"], tuple):
+        return None
+    cache_version, patch = snapshot["version"]
+    if cache_version != SKINS_CACHE_VERSION:
+        return None
+
+    champs = {}
+    for champ_name, (key, skins) in snapshot["data"].items():
+        champ = Champ(name=champ_name, key=key)
+        champ.skins = skins
+        champs[champ_name] = champ
+    return {"champs": champs, **snapshot["meta"], "patch": patch}
+
+
+def _save_catalog(catalog):
+    # Plain tuples so the file does not depend on where Champ is imported from
+    data = {name: (champ.key, champ.skins) for name, champ in catalog["champs"].items()}
+    meta = {k: v for k, v in catalog.items() if k not in ("champs", "patch")}
+    save_snapshot(SKINS_CACHE, data, (SKINS_CACHE_VERSION, catalog.get("patch")), meta)
+
+
+def fetch_all_champion_skins(force_refresh=False):
+    """Fetch all champion skins, from the on-disk cache while it is fresh
+
+    The cache is keyed by the client's patch. A cache from another patch or
+    older than REVALIDATE_INTERVAL is revalidated with ETag/If-Modified-Since,
+    and still used when Community Dragon cannot be reached.
+    """
+    global _catalog
 
-        return champs
+    if _catalog is None:
+        _catalog = _load_cached_catalog()
+
+    patch = get_client_patch()
+    if (_catalog is not None and not force_refresh
+            and (patch is None or _catalog.get("patch") == patch)
+            and time.time() - _catalog.get("checked_at", 0) < REVALIDATE_INTERVAL):
+        return _catalog["champs"]
+
+    headers = {}
+    if _catalog is not None:
+        if _catalog.get("etag"):
+            headers["If-None-Match"] = _catalog["etag"]
+        if _catalog.get("last_modified"):
+            headers["If-Modified-Since"] = _catalog["last_modified"]
+    
+    try:
+        response = requests.get(SKINS_URL, headers=headers, timeout=10)
+
+        if response.status_code == 304 and _catalog is not None:
+            _catalog["checked_at"] = time.time()
+            _catalog["patch"] = patch or _catalog.get("patch")
+            _save_catalog(_catalog)
+            return _catalog["champs"]
+        
+        if response.status_code != 200:
+            if _catalog is not None:
+                return _catalog["champs"]
+            print(colored("Error while searching skins.", "red"))
+            return None
+        
+        _catalog = {
+            "champs": parse_skins(response.json()),
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "checked_at": time.time(),
+            "patch": patch,
+        }
+        _save_catalog(_catalog)
+        return _catalog["champs"]
         
     except requests.exceptions.RequestException as e:
+        if _catalog is not None:
+            print(colored("Offline, using cached skins.", "yellow"))
+            return _catalog["champs"]
         print(colored(f"Network error: {e}", "red"))
         return None
     except Exception as e:
+        if _catalog is not None:
+            print(colored(f"Error refreshing skins, using cached skins: {e}", "yellow"))
+            return _catalog["champs"]
         print(colored(f"Error parsing skins: {e}", "red"))
         return None
 
 
-def search_skins_by_name(champions, search_query):
-    """Search skins by champion name or skin name"""
-    found_skins = []
-    search_lower = search_query.lower()
-    
-    for champ_name, champ_data in champions.items():
-        if search_lower in champ_name.lower():
-            found_skins.extend(champ_data.skins)
-        else:
+_PUNCTUATION = re.compile(r"[^\w\s']")
+
+
+def normalize_name(text):
+    """Lowercase and drop accents and punctuation, so Kai'Sa matches kaisa"""
+    text = unicodedata.normalize("NFKD", text.lower())
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    return " ".join(_PUNCTUATION.sub(" ", text).replace("'", "").split())
+
+
+class SkinIndex:
+    """Substring index over a skins catalog, built once per catalog"""
+
+    # Substrings up to this length are looked up directly, longer ones intersect these grams
+    GRAM = 3
+
+    def __init__(self, champions):
+        self.champ_skins = {}
+        self.entries = []
+        self._champ_names = []
+        self._postings = {}
+
+        for champ_name, champ_data in champions.items():
+            self.champ_skins[champ_name] = champ_data.skins
+            self._champ_names.append((champ_name, normalize_name(champ_name)))
             for skin in champ_data.skins:
-                if search_lower in skin['name'].lower():
-                    found_skins.append(skin)
-    
-    return found_skins
+                normalized = normalize_name(skin['name'])
+                self._add(len(self.entries), normalized)
+                self.entries.append((skin, normalized))
+
+    def _add(self, entry_id, text):
+        for size in range(1, self.GRAM + 1):
+            for start in range(len(text) - size + 1):
+                self._postings.setdefault(text[start:start + size], set()).add(entry_id)
+
+    def _candidates(self, query):
+        if len(query) <= self.GRAM:
+            return self._postings.get(query, set())
+        grams = [query[i:i + self.GRAM] for i in range(len(query) - self.GRAM + 1)]
+        postings = sorted((self._postings.get(g, set()) for g in grams), key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates &= posting
+            if not candidates:
+                break
+        return {i for i in candidates if query in self.entries[i][1]}
+
+    @staticmethod
+    def _rank(name, query):
+        if name.startswith(query):
+            return 0
+        if (" " + query) in name:
+            return 1
+        return 2
+
+    def search(self, query, limit=None):
+        """Skins of matching champions first, then matching skins, best matches first"""
+        query = normalize_name(query)
+        if not query:
+            return []
+
+        found = []
+        matched_champs = sorted(
+            (self._rank(normalized, query), champ_name)
+            for champ_name, normalized in self._champ_names
+            if query in normalized
+        )
+        for _, champ_name in matched_champs:
+            found.extend(self.champ_skins[champ_name])
+
+        skip = {id(skin) for skin in found}
+        buckets = ([], [], [])
+        for i in sorted(self._candidates(query)):
+            skin, normalized = self.entries[i]
+            if not skip or id(skin) not in skip:
+                buckets[self._rank(normalized, query)].append(skin)
+        for bucket in buckets:
+            found.extend(bucket)
+
+        return found[:limit] if limit else found
+
+
+_index = None
+_index_source = None
+
+
+def get_skin_index(champions):
+    """Return the index for a catalog, rebuilding it only when the catalog changes"""
+    global _index, _index_source
+    if _index is None or _index_source is not champions:
+        _index = SkinIndex(champions)
+        _index_source = champions
+    return _index
+
+
+def search_skins_by_name(champions, search_query, limit=None):
+    """Search skins by champion name or skin name"""
+    return get_skin_index(champions).search(search_query, limit)
 
 
 def change_profile_background(skin_id):
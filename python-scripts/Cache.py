@@ -0,0 +1,81 @@
+"""
+On-disk snapshots for data that only changes between patches.
+"""
+
+import os
+import sys
+import pickle
+import tempfile
+import logging
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# Bump when the snapshot envelope changes so old files are ignored
+SNAPSHOT_FORMAT = 1
+
+# Set LTK_CACHE_DIR to keep the cache somewhere else
+CACHE_DIR_ENV = "LTK_CACHE_DIR"
+
+
+def cache_dir() -> str:
+    """Return the cache directory, creating it if needed."""
+    path = os.environ.get(CACHE_DIR_ENV)
+    if not path:
+        if sys.platform == "win32":
+            base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+        else:
+            base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+        path = os.path.join(base, "LTK")
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def _snapshot_path(name: str) -> str:
+    return os.path.join(cache_dir(), f"{name}.pickle")
+
+
+def load_snapshot(name: str, version: Any = None) -> Optional[dict]:
+    """
+    Load a snapshot saved with save_snapshot.
+
+    Returns:
+        {"version", "meta", "data"}, or None if missing, unreadable or saved for another version
+    """
+    try:
+        with open(_snapshot_path(name), "rb") as f:
+            snapshot = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"⚠️ Ignoring unreadable {name} cache: {e}")
+        return None
+
+    if not isinstance(snapshot, dict) or snapshot.get("format") != SNAPSHOT_FORMAT:
+        return None
+    if version is not None and snapshot.get("version") != version:
+        return None
+    return snapshot
+
+
+def save_snapshot(name: str, data: Any, version: Any = None, meta: Optional[dict] = None) -> bool:
+    """Atomically write a snapshot so readers never see a partial file."""
+    snapshot = {
+        "format": SNAPSHOT_FORMAT,
+        "version": version,
+        "meta": meta or {},
+        "data": data,
+    }
+
+    tmp_path = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(prefix=f".{name}.", dir=cache_dir())
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, _snapshot_path(name))
+        return True
+    except Exception as e:
+        logger.warning(f"⚠️ Could not save {name} cache: {e}")
+        if tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return False
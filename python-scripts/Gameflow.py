@@ -0,0 +1,142 @@
+"""
+Shared gameflow phase watcher - one phase stream instead of one poller per monitor.
+"""
+
+import threading
+import time
+import logging
+from typing import Callable, Dict, Iterable, List, Optional
+
+from Rengar import Rengar
+from LCUEvents import get_event_client, GAMEFLOW_PHASE_EVENT
+
+logger = logging.getLogger(__name__)
+
+# How often to ask for the phase while the event socket is down
+PHASE_POLL_INTERVALS: Dict[str, float] = {
+    "None": 2.0,
+    "Lobby": 1.0,
+    "Matchmaking": 0.5,
+    "ReadyCheck": 0.5,
+    "ChampSelect": 1.0,
+    "InProgress": 5.0,
+}
+DEFAULT_POLL_INTERVAL = 2.0
+
+# How often to check the socket is still up while phases are being pushed
+EVENT_RECHECK_INTERVAL = 1.0
+
+PhaseCallback = Callable[[str, str], None]
+
+
+class GameflowWatcher:
+    """Tracks the gameflow phase and wakes monitors waiting for the phases they care about."""
+
+    def __init__(self, rengar=None, events=None):
+        self.rengar = rengar or Rengar()
+        self.events = events
+
+        self._phase = "None"
+        self._callbacks: List[PhaseCallback] = []
+        self._changed = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self.is_running = False
+
+    def phase(self) -> str:
+        """Last known phase ("None" until the client has been reached)."""
+        return self._phase
+
+    def wait_for(self, phases: Iterable[str], timeout: Optional[float] = None) -> str:
+        """
+        Block until the phase is one of phases or timeout expires.
+
+        Returns:
+            The phase at wake-up, check it against phases to tell a timeout apart
+        """
+        phases = set(phases)
+        with self._changed:
+            self._changed.wait_for(lambda: self._phase in phases, timeout)
+            return self._phase
+
+    def on_change(self, callback: PhaseCallback) -> None:
+        """Call callback(old_phase, new_phase) on every phase change."""
+        with self._changed:
+            self._callbacks.append(callback)
+
+    def start(self) -> None:
+        """Start watching, through the event socket when possible."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        if self.events is None:
+            self.events = get_event_client()
+        self.events.subscribe(GAMEFLOW_PHASE_EVENT, self._on_phase_event)
+
+        self.is_running = True
+        self._thread = threading.Thread(target=self._run, daemon=True, name="Gameflow")
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop watching."""
+        self.is_running = False
+        if self.events is not None:
+            self.events.unsubscribe(GAMEFLOW_PHASE_EVENT, self._on_phase_event)
+
+    def _on_phase_event(self, payload: dict) -> None:
+        phase = payload.get("data")
+        if isinstance(phase, str):
+            self._set_phase(phase)
+
+    def _set_phase(self, phase: str) -> None:
+        with self._changed:
+            old = self._phase
+            if phase == old:
+                return
+            self._phase = phase
+            callbacks = list(self._callbacks)
+            self._changed.notify_all()
+
+        logger.debug(f"🎮 Gameflow phase: {old} -> {phase}")
+        for callback in callbacks:
+            try:
+                callback(old, phase)
+            except Exception as e:
+                logger.error(f"❌ Error in gameflow phase handler: {e}")
+
+    def _poll(self) -> None:
+        try:
+            response = self.rengar.lcu_request("GET", "/lol-gameflow/v1/gameflow-phase", "")
+            if response.status_code == 200:
+                self._set_phase(response.json())
+        except Exception as e:
+            logger.debug(f"Could not read gameflow phase: {e}")
+
+    def _run(self) -> None:
+        seeded = False
+
+        while self.is_running:
+            if self.events.is_connected():
+                # Events only carry later changes, so seed the phase with one poll
+                if not seeded:
+                    self._poll()
+                    seeded = True
+                time.sleep(EVENT_RECHECK_INTERVAL)
+                continue
+
+            seeded = False
+            self._poll()
+            time.sleep(PHASE_POLL_INTERVALS.get(self._phase, DEFAULT_POLL_INTERVAL))
+
+
+_watcher: Optional[GameflowWatcher] = None
+_watcher_lock = threading.Lock()
+
+
+def get_gameflow_watcher() -> GameflowWatcher:
+    """Return the process-wide gameflow watcher, starting it on first use."""
+    global _watcher
+    with _watcher_lock:
+        if _watcher is None:
+            _watcher = GameflowWatcher()
+            _watcher.start()
+        return _watcher
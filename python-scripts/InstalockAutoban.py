@@ -5,13 +5,26 @@ Refactored champion select automation - cleaner separation of concerns.
 import threading
 import time
 import random
+import queue
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Set
 from difflib import get_close_matches
+from typing import Optional, List, Dict, Set
 import logging
 
+from Cache import load_snapshot, save_snapshot
+from LCUEvents import get_event_client, CHAMP_SELECT_SESSION_EVENT
+from Scheduler import get_scheduler
+from Metrics import LatencyTracker
+
 logger = logging.getLogger(__name__)
 
+# With events, re-evaluate the last known session this often even without a push
+EVENT_RECHECK_INTERVAL = 1.0
+
+# Phases the champ select monitor runs in, it sleeps on the gameflow watcher otherwise
+CHAMP_SELECT_PHASES = ("ChampSelect",)
+PHASE_GATE_TIMEOUT = 1.0
+
 
 @dataclass
 class ChampionSelection:
@@ -40,14 +53,110 @@ class SelectionOptions:
     avoid_ally_hovers: bool = True
 
 
+CHAMPION_SNAPSHOT = "champions"
+
+# Common nicknames, keyed by the normalized nickname
+CHAMPION_NICKNAMES = {
+    "mf": "missfortune",
+    "tf": "twistedfate",
+    "ww": "warwick",
+    "j4": "jarvaniv",
+    "asol": "aurelionsol",
+    "gp": "gangplank",
+    "tk": "tahmkench",
+    "lb": "leblanc",
+    "yi": "masteryi",
+    "mundo": "drmundo",
+    "nunu": "nunuwillump",
+    "kog": "kogmaw",
+    "kha": "khazix",
+    "rek": "reksai",
+    "vel": "velkoz",
+    "xin": "xinzhao",
+    "monkeyking": "wukong",
+    "cass": "cassiopeia",
+    "kass": "kassadin",
+    "heimer": "heimerdinger",
+    "fiddle": "fiddlesticks",
+    "blitz": "blitzcrank",
+    "naut": "nautilus",
+    "malph": "malphite",
+    "morg": "morgana",
+    "noc": "nocturne",
+    "voli": "volibear",
+}
+
+
+def normalize_champion_name(name: str) -> str:
+    """Lowercase and keep only letters and digits: "Kai'Sa" -> "kaisa", "Dr. Mundo" -> "drmundo"."""
+    return "".join(c for c in name.lower() if c.isalnum())
+
+
+def _trigrams(text: str) -> Set[str]:
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
 class ChampionRegistry:
     """Manages champion data and name/ID conversion."""
     
     def __init__(self, rengar):
         self.rengar = rengar
         self._champ_dict: Dict[str, int] = {}
+        self._id_to_name: Dict[int, str] = {}
+        self._keys: Dict[str, int] = {}
+        self._prefixes: Dict[str, int] = {}
+        self._trigram_index: Dict[str, List[str]] = {}
+        self._key_names: Dict[str, str] = {}
+        self._entries: List[dict] = []
+        self._version: Optional[str] = None
+        self._refresh_thread: Optional[threading.Thread] = None
         self._lock = threading.Lock()
     
+    def load_snapshot(self) -> bool:
+        """Load the champion table saved for the last seen client patch."""
+        snapshot = load_snapshot(CHAMPION_SNAPSHOT)
+        if snapshot is None or not snapshot["data"]:
+            return False
+        
+        self._parse_data(snapshot["data"])
+        self._version = snapshot["version"]
+        logger.info(f"✅ Loaded {len(self._champ_dict)} champions from cache (patch {self._version})")
+        return True
+    
+    def _get_game_version(self) -> Optional[str]:
+        try:
+            response = self.rengar.lcu_request("GET", "/lol-patch/v1/game-version", "")
+            if response.status_code == 200:
+                return response.json()
+        except Exception as e:
+            logger.debug(f"Could not read game version: {e}")
+        return None
+    
+    def refresh(self) -> bool:
+        """Reload from the client only when its patch differs from the loaded one."""
+        version = self._get_game_version()
+        if version is not None and version == self._version and self.is_loaded():
+            return True
+        
+        if not self.load():
+            return False
+        
+        self._version = version
+        if version is not None:
+            save_snapshot(CHAMPION_SNAPSHOT, self._entries, version)
+        return True
+    
+    def refresh_in_background(self) -> None:
+        """Run refresh() off the caller's thread, it waits for the client if needed."""
+        if self._refresh_thread is None or not self._refresh_thread.is_alive():
+            self._refresh_thread = threading.Thread(
+                target=self.refresh,
+                daemon=True,
+                name="ChampionRegistryRefresh"
+            )
+            self._refresh_thread.start()
+    
     def load(self) -> bool:
         """Load champion list from client."""
         try:
@@ -74,17 +183,61 @@ class ChampionRegistry:
             return False
     
     def _parse_data(self, data: List[dict], filter_invalid: bool = False) -> None:
-        """Parse champion data from API response."""
-        with self._lock:
-            self._champ_dict.clear()
-            for champ in data:
-                champ_id = champ.get("id")
-                champ_name = champ.get("name")
+        """Parse champion data from API response and build the lookup tables."""
+        champ_dict: Dict[str, int] = {}
+        id_to_name: Dict[int, str] = {}
+        keys: Dict[str, int] = {}
+        key_names: Dict[str, str] = {}
+        entries: List[dict] = []
+        
+        for champ in data:
+            champ_id = champ.get("id")
+            champ_name = champ.get("name")
+            
+            if champ_id and champ_name:
+                if filter_invalid and champ_id == -1:
+                    continue
+                entries.append({"id": champ_id, "name": champ_name, "alias": champ.get("alias")})
+                champ_dict[champ_name.lower()] = champ_id
+                id_to_name[champ_id] = champ_name
+                
+                key = normalize_champion_name(champ_name)
+                keys[key] = champ_id
+                key_names[key] = champ_name
                 
-                if champ_id and champ_name:
-                    if filter_invalid and champ_id == -1:
-                        continue
-                    self._champ_dict[champ_name.lower()] = champ_id
+                # Internal names such as MonkeyKing for Wukong
+                alias = normalize_champion_name(champ.get("alias") or "")
+                if alias:
+                    keys.setdefault(alias, champ_id)
+        
+        # Nicknames and initials ("mf", "tf") never shadow a real name
+        for nickname, key in CHAMPION_NICKNAMES.items():
+            if key in keys:
+                keys.setdefault(nickname, keys[key])
+        for champ_name, champ_id in champ_dict.items():
+            words = [w for w in champ_name.replace("'", "").split() if w[0].isalnum()]
+            if len(words) > 1:
+                keys.setdefault("".join(w[0] for w in words), champ_id)
+        
+        # Shortest name wins a shared prefix, so "vi" is Vi and not Viego
+        prefixes: Dict[str, int] = {}
+        for key in sorted(key_names, key=lambda k: (len(k), k)):
+            for end in range(1, len(key) + 1):
+                prefixes.setdefault(key[:end], keys[key])
+        
+        trigram_index: Dict[str, List[str]] = {}
+        for key in key_names:
+            for gram in _trigrams(key):
+                trigram_index.setdefault(gram, []).append(key)
+        
+        with self._lock:
+            self._champ_dict = champ_dict
+            self._id_to_name = id_to_name
+            self._keys = keys
+            self._key_names = key_names
+            self._prefixes = prefixes
+            self._trigram_index = trigram_index
+            self._entries = entries
     
     def get_id(self, name: str) -> int:
         """Convert champion name to ID. Returns -1 if not found."""
@@ -97,58 +250,104 @@ class ChampionRegistry:
         if name in self._champ_dict:
             return self._champ_dict[name]
         
-        # Partial match
-        for champ_name, champ_id in self._champ_dict.items():
-            if name in champ_name or champ_name in name:
-                return champ_id
+        # Normalized name, internal alias or nickname
+        key = normalize_champion_name(name)
+        if key in self._keys:
+            return self._keys[key]
+        
+        # Partial match: a prefix of a name, or a name inside the input ("yasuo mid")
+        if key in self._prefixes:
+            return self._prefixes[key]
+        for word in name.split():
+            word_key = normalize_champion_name(word)
+            if word_key in self._keys:
+                return self._keys[word_key]
+        
+        # Anywhere inside a name ("sin" -> Lee Sin), candidates come from the trigram index
+        if len(key) >= 3:
+            candidates = None
+            for i in range(len(key) - 2):
+                posting = set(self._trigram_index.get(key[i:i + 3], ()))
+                candidates = posting if candidates is None else candidates & posting
+                if not candidates:
+                    break
+            for candidate in sorted(candidates or (), key=lambda k: (len(k), k)):
+                if key in candidate:
+                    return self._keys[candidate]
         
         return -1
     
+    def _fuzzy_keys(self, key: str, limit: int, cutoff: float) -> List[str]:
+        """Best normalized names by trigram similarity (Dice coefficient)."""
+        grams = _trigrams(key)
+        shared: Dict[str, int] = {}
+        for gram in grams:
+            for candidate in self._trigram_index.get(gram, ()):
+                shared[candidate] = shared.get(candidate, 0) + 1
+        
+        scored = []
+        for candidate, count in shared.items():
+            score = 2 * count / (len(grams) + len(candidate) + 1)
+            if score >= cutoff:
+                scored.append((-score, candidate))
+        scored.sort()
+        return [candidate for _, candidate in scored[:limit]]
+    
     def get_suggestions(self, partial: str, limit: int = 5) -> List[str]:
         """Get champion name suggestions for partial input."""
         if not self._champ_dict:
             return []
         
-        partial = partial.lower().strip()
-        all_names = list(self._champ_dict.keys())
+        key = normalize_champion_name(partial)
+        if not key:
+            return []
         
         # Fuzzy matching
-        matches = get_close_matches(partial, all_names, n=limit, cutoff=0.6)
+        matches = self._fuzzy_keys(key, limit, cutoff=0.4)
+        
+        # Typos in short names ("zde") share no trigram, fall back to edit similarity
+        if len(matches) < limit:
+            matches += [k for k in get_close_matches(key, list(self._key_names), n=limit, cutoff=0.6)
+                        if k not in matches]
         
         # Partial matches
-        partial_matches = [n for n in all_names if partial in n and n not in matches]
+        if len(matches) < limit:
+            matches += [k for k in self._key_names if key in k and k not in matches]
         
-        suggestions = matches + partial_matches
-        return [name.title() for name in suggestions[:limit]]
+        return [self._key_names[k] for k in matches[:limit]]
     
     def get_all_ids(self) -> List[int]:
         """Get all champion IDs."""
-        return list(self._champ_dict.values())
+        return list(self._id_to_name)
     
     def get_name(self, champ_id: int) -> str:
         """Get champion name from ID."""
-        for name, cid in self._champ_dict.items():
-            if cid == champ_id:
-                return name.title()
-        return "Unknown"
+        return self._id_to_name.get(champ_id, "Unknown")
     
     def is_loaded(self) -> bool:
         """Check if champion data is loaded."""
         return bool(self._champ_dict)
+    
+    def count(self) -> int:
+        """Number of loaded champions."""
+        return len(self._champ_dict)
 
 
 class ChampSelectSession:
     """Handles champion select session queries."""
     
-    def __init__(self, rengar):
+    def __init__(self, rengar, latency: Optional[LatencyTracker] = None):
         self.rengar = rengar
+        self.latency = latency or LatencyTracker()
     
     def get_session(self) -> Optional[dict]:
         """Get current champion select session data."""
         try:
-            response = self.rengar.lcu_request("GET", "/lol-champ-select/v1/session", "")
+            with self.latency.span("session_fetch"):
+                response = self.rengar.lcu_request("GET", "/lol-champ-select/v1/session", "")
             if response.status_code == 200 and "RPC_ERROR" not in response.text:
-                return response.json()
+                with self.latency.span("json_decode"):
+                    return response.json()
             return None
         except Exception:
             return None
@@ -156,127 +355,248 @@ class ChampSelectSession:
     def get_cell_id(self, session: dict) -> Optional[int]:
         """Get local player's cell ID from session."""
         return session.get("localPlayerCellId")
+
+
+class SessionIndex:
+    """Single pass over a champion select session, so selector queries are lookups."""
     
-    def is_champion_banned(self, champion_id: int, session: dict) -> bool:
-        """Check if champion is already banned."""
-        # Check completed ban actions
+    def __init__(self, session: dict, cell_id: Optional[int] = None):
+        self.session = session
+        self.cell_id = session.get("localPlayerCellId") if cell_id is None else cell_id
+        self.banned: Set[int] = set()
+        self.ally_hovers: List[int] = []
+        self.my_actions: List[dict] = []
+        self.my_pending: Dict[str, List[dict]] = {}
+        self.in_progress: Optional[dict] = None
+        
+        hovered: Set[int] = set()
         for actions in session.get("actions", []):
             if not isinstance(actions, list):
                 continue
             
             for action in actions:
-                if (action.get("type") == "ban" and
-                    action.get("completed") and
-                    action.get("championId") == champion_id):
-                    return True
+                action_type = action.get("type")
+                champ_id = action.get("championId") or 0
+                completed = action.get("completed", False)
+                
+                if action_type == "ban" and completed and champ_id:
+                    self.banned.add(champ_id)
+                
+                if action.get("actorCellId") == self.cell_id:
+                    self.my_actions.append(action)
+                    if not completed:
+                        self.my_pending.setdefault(action_type, []).append(action)
+                        if action.get("isInProgress") and self.in_progress is None:
+                            self.in_progress = action
+                elif action_type == "pick" and champ_id > 0 and not completed:
+                    if champ_id not in hovered:
+                        hovered.add(champ_id)
+                        self.ally_hovers.append(champ_id)
         
-        # Check bans object
         bans = session.get("bans", {})
         if isinstance(bans, dict):
             for team_bans in bans.values():
-                if isinstance(team_bans, list) and champion_id in team_bans:
-                    return True
+                if isinstance(team_bans, list):
+                    self.banned.update(team_bans)
         
-        return False
+        self.ally_hover_set = hovered
+    
+    def is_banned(self, champion_id: int) -> bool:
+        """Check if champion is already banned."""
+        return champion_id in self.banned
+    
+    def pending_action(self, action_type: str) -> Optional[dict]:
+        """First not yet completed action of this type for the local player."""
+        pending = self.my_pending.get(action_type)
+        return pending[0] if pending else None
+
+
+@dataclass
+class SessionChanges:
+    """What changed between two consecutive session snapshots."""
+    new_session: bool = False
+    phase: str = ""
+    phase_changed: bool = False
+    started_actions: List[dict] = field(default_factory=list)
+    new_bans: Set[int] = field(default_factory=set)
+    hovers_changed: bool = False
+    
+    @property
+    def changed(self) -> bool:
+        return bool(self.new_session or self.phase_changed or self.started_actions or
+                    self.new_bans or self.hovers_changed)
+
+
+class ChampSelectTracker:
+    """Follows one champion select (by gameId) and diffs consecutive snapshots."""
+    
+    def __init__(self):
+        self.reset()
     
-    def get_ally_hovers(self, session: dict, cell_id: int) -> List[int]:
-        """Get list of champions that allies have hovered."""
-        ally_hovers = []
+    def reset(self) -> None:
+        """Forget the current session."""
+        self.session_key = None
+        self.phase = ""
+        self._in_progress: Set[int] = set()
+        self._banned: Set[int] = set()
+        self._hovers: Set[int] = set()
+    
+    def update(self, index: SessionIndex) -> SessionChanges:
+        """Record a new snapshot and return only what changed since the previous one."""
+        session = index.session
+        # gameId is stable for the whole champ select, unlike the payload object
+        key = (session.get("gameId"), index.cell_id)
+        phase = session.get("timer", {}).get("phase", "")
         
-        for actions in session.get("actions", []):
-            if not isinstance(actions, list):
-                continue
-            
-            for action in actions:
-                if action.get("actorCellId") == cell_id:
-                    continue
-                
-                if action.get("type") == "pick":
-                    champ_id = action.get("championId", 0)
-                    if champ_id > 0 and not action.get("completed", False):
-                        if champ_id not in ally_hovers:
-                            ally_hovers.append(champ_id)
+        changes = SessionChanges(phase=phase)
+        if key != self.session_key:
+            self.reset()
+            self.session_key = key
+            changes.new_session = True
+        
+        changes.phase_changed = phase != self.phase
+        self.phase = phase
+        
+        in_progress = set()
+        for action in index.my_actions:
+            if action.get("isInProgress") and not action.get("completed"):
+                in_progress.add(action.get("id"))
+                if action.get("id") not in self._in_progress:
+                    changes.started_actions.append(action)
+        self._in_progress = in_progress
+        
+        changes.new_bans = index.banned - self._banned
+        self._banned = set(index.banned)
         
-        return ally_hovers
+        changes.hovers_changed = index.ally_hover_set != self._hovers
+        self._hovers = set(index.ally_hover_set)
+        
+        return changes
+
+
+def _ordinal(rank: int) -> str:
+    return f"{rank}{'st' if rank == 1 else 'nd' if rank == 2 else 'rd'}"
+
+
+@dataclass
+class PlannedChoice:
+    """Head of a plan, sent as-is the moment our turn opens."""
+    champion_id: int = -1
+    name: str = ""
+    rank: int = 0
 
 
-class ChampionSelector:
-    """Selects champions based on configuration and availability."""
+class ActionPlan:
+    """Ranked candidates for one action type, resolved once and re-ranked only on changes."""
     
-    def __init__(self, registry: ChampionRegistry, session_handler: ChampSelectSession):
-        self.registry = registry
-        self.session = session_handler
-    
-    def select_pick(self, config: ChampionSelection, session_data: dict) -> int:
-        """Select a champion to pick based on configuration."""
-        # Random selection
-        if config.primary == "Random":
-            available = [
-                cid for cid in self.registry.get_all_ids()
-                if not self.session.is_champion_banned(cid, session_data)
-            ]
-            return random.choice(available) if available else -1
-        
-        # Try champions in priority order
-        for i, champ_name in enumerate(config.get_champions(), 1):
-            champ_id = self.registry.get_id(champ_name)
-            
-            if champ_id == -1:
-                continue
-            
-            if self.session.is_champion_banned(champ_id, session_data):
-                logger.warning(f"⚠️ {i}{'st' if i==1 else 'nd' if i==2 else 'rd'} choice {champ_name.title()} is BANNED")
-                continue
-            
-            logger.info(f"✅ Picking {i}{'st' if i==1 else 'nd' if i==2 else 'rd'} choice: {champ_name.title()}")
-            return champ_id
+    def __init__(self, action_type: str):
+        self.action_type = action_type
+        self.head = PlannedChoice()
+        self._candidates: List[PlannedChoice] = []
+        self._random = False
+        self._config_key = None
+    
+    def configure(self, config: ChampionSelection, registry: ChampionRegistry) -> bool:
+        """Resolve configured names to ids. Returns True if the candidates changed."""
+        names = tuple(config.get_champions())
+        # The registry count changes when champion data (re)loads and ids can resolve
+        key = (names, registry.count())
+        if key == self._config_key:
+            return False
         
-        logger.error("🚫 All pick options unavailable!")
-        return -1
+        self._config_key = key
+        self._random = self.action_type == "pick" and config.primary == "Random"
+        self._candidates = []
+        for rank, name in enumerate(names, 1):
+            champ_id = registry.get_id(name)
+            if champ_id != -1:
+                self._candidates.append(PlannedChoice(champ_id, registry.get_name(champ_id), rank))
+        return True
     
-    def select_ban(self, config: ChampionSelection, session_data: dict, 
-                   cell_id: int, avoid_ally_hovers: bool) -> int:
-        """Select a champion to ban based on configuration."""
-        # Get ally hovers if needed
-        ally_hovers = []
-        if avoid_ally_hovers:
-            ally_hovers = self.session.get_ally_hovers(session_data, cell_id)
-            if ally_hovers:
-                logger.info(f"🛡️ Protecting {len(ally_hovers)} ally champion(s)")
-        
-        # Try champions in priority order
-        for i, champ_name in enumerate(config.get_champions(), 1):
-            champ_id = self.registry.get_id(champ_name)
-            
-            if champ_id == -1:
-                continue
-            
-            if self.session.is_champion_banned(champ_id, session_data):
-                logger.warning(f"⚠️ {i}{'st' if i==1 else 'nd' if i==2 else 'rd'} ban {champ_name.title()} already BANNED")
+    def rank(self, index: SessionIndex, registry: ChampionRegistry,
+             avoid: Set[int] = frozenset()) -> PlannedChoice:
+        """Move the head to the best candidate that is not banned or in avoid."""
+        previous = self.head
+        
+        if self._random:
+            # Keep the random champion for the whole session unless it gets banned
+            if previous.champion_id > 0 and not index.is_banned(previous.champion_id):
+                return previous
+            available = [cid for cid in registry.get_all_ids() if cid not in index.banned]
+            if available:
+                champ_id = random.choice(available)
+                self.head = PlannedChoice(champ_id, registry.get_name(champ_id), 1)
+            else:
+                self.head = PlannedChoice()
+            return self.head
+        
+        self.head = PlannedChoice()
+        for choice in self._candidates:
+            if index.is_banned(choice.champion_id):
+                logger.warning(f"⚠️ {_ordinal(choice.rank)} {self.action_type} {choice.name.title()} is BANNED")
                 continue
-            
-            if champ_id in ally_hovers:
-                logger.warning(f"👥 {i}{'st' if i==1 else 'nd' if i==2 else 'rd'} ban {champ_name.title()} wanted by ALLY")
+            if choice.champion_id in avoid:
+                logger.warning(f"👥 {_ordinal(choice.rank)} {self.action_type} {choice.name.title()} wanted by ALLY")
                 continue
-            
-            logger.info(f"✅ Banning {i}{'st' if i==1 else 'nd' if i==2 else 'rd'} choice: {champ_name.title()}")
-            return champ_id
+            self.head = choice
+            break
         
-        logger.error("🚫 All ban options unavailable!")
-        return -1
+        if self.head.champion_id != previous.champion_id and self.head.champion_id != -1:
+            logger.debug(f"📝 {self.action_type.title()} plan: {self.head.name.title()} ({_ordinal(self.head.rank)} choice)")
+        return self.head
+
+
+class ChampionPlanner:
+    """Keeps the pick and ban choices for the current session ready before our turn comes."""
+    
+    def __init__(self, registry: ChampionRegistry):
+        self.registry = registry
+        self.reset()
+    
+    def reset(self) -> None:
+        """Drop the plans of the previous session."""
+        self.pick = ActionPlan("pick")
+        self.ban = ActionPlan("ban")
+        self._avoid_ally_hovers: Optional[bool] = None
+    
+    def update(self, instalock: ChampionSelection, auto_ban: ChampionSelection,
+               options: SelectionOptions, index: SessionIndex, changes: SessionChanges) -> None:
+        """Re-rank only the plans affected by this snapshot's changes."""
+        if changes.new_session:
+            self.reset()
+        
+        pick_dirty = self.pick.configure(instalock, self.registry)
+        ban_dirty = self.ban.configure(auto_ban, self.registry)
+        if options.avoid_ally_hovers != self._avoid_ally_hovers:
+            self._avoid_ally_hovers = options.avoid_ally_hovers
+            ban_dirty = True
+        
+        if changes.new_session or changes.new_bans:
+            pick_dirty = ban_dirty = True
+        if changes.hovers_changed and options.avoid_ally_hovers:
+            ban_dirty = True
+        
+        if pick_dirty:
+            self.pick.rank(index, self.registry)
+        if ban_dirty:
+            avoid = index.ally_hover_set if options.avoid_ally_hovers else frozenset()
+            if avoid:
+                logger.debug(f"🛡️ Protecting {len(avoid)} ally champion(s)")
+            self.ban.rank(index, self.registry, avoid)
 
 
 class InstalockAutoban:
     """Main class for champion select automation."""
     
     def __init__(self):
-        import Rengar
+        from Rengar import Rengar
         self.rengar = Rengar()
         
         # Components
+        self.latency = LatencyTracker()
         self.registry = ChampionRegistry(self.rengar)
-        self.session_handler = ChampSelectSession(self.rengar)
-        self.selector = ChampionSelector(self.registry, self.session_handler)
+        self.session_handler = ChampSelectSession(self.rengar, self.latency)
+        self.planner = ChampionPlanner(self.registry)
         
         # Configuration
         self.instalock = ChampionSelection()
@@ -288,14 +608,26 @@ class InstalockAutoban:
         self.is_running = False
         self._lock = threading.Lock()
         
+        # Event feed (falls back to polling while the socket is down)
+        self.events = None
+        self._session_events: "queue.Queue[Optional[dict]]" = queue.Queue()
+        self._last_event_session: Optional[dict] = None
+        self._using_events = False
+        
         # State tracking
-        self._last_session_id = None
+        self.tracker = ChampSelectTracker()
+        self.scheduler = None
         self._processed_actions: Set[int] = set()
+        self._pending_actions: Set[int] = set()
+        self._turn_started: Dict[int, float] = {}
         self._pre_hover_done = False
+        self._hovered_champion: Optional[int] = None
         
+        # Cached table first, the client is only asked again when its patch changes
         logger.info("📄 Loading champion data...")
-        if not self.registry.load():
+        if not self.registry.load_snapshot():
             logger.warning("⚠️ Champion list will be loaded when client is available")
+        self.registry.refresh_in_background()
     
     # Compatibility properties for main.py
     @property
@@ -444,6 +776,12 @@ class InstalockAutoban:
     # Monitoring
     def start_monitor(self) -> None:
         """Start champion select monitoring."""
+        if self.events is None:
+            self.events = get_event_client()
+            self.events.subscribe(CHAMP_SELECT_SESSION_EVENT, self._on_session_event)
+        if self.scheduler is None:
+            self.scheduler = get_scheduler()
+        
         if self.monitor_thread is None or not self.monitor_thread.is_alive():
             self.is_running = True
             self.monitor_thread = threading.Thread(
@@ -465,6 +803,63 @@ class InstalockAutoban:
             self.monitor_thread.join(timeout=2)
         logger.info("🛑 Monitor stopped")
     
+    def _on_session_event(self, payload: dict) -> None:
+        """Queue a pushed champion select session (None when the session ends)."""
+        if payload.get("eventType") == "Delete":
+            self._session_events.put(None)
+        else:
+            self._session_events.put(payload.get("data"))
+    
+    def _next_session(self, wait: float) -> Optional[dict]:
+        """Wait for the next session snapshot, from events when connected or by polling."""
+        if self.events is not None and self.events.is_connected():
+            if not self._using_events:
+                # Events only carry later changes, so seed the state with one poll
+                self._using_events = True
+                self._drain_session_events()
+                self._last_event_session = self.session_handler.get_session()
+                return self._last_event_session
+            
+            try:
+                session = self._session_events.get(timeout=EVENT_RECHECK_INTERVAL)
+                self._last_event_session = self._drain_session_events(session)
+            except queue.Empty:
+                pass
+            return self._last_event_session
+        
+        self._using_events = False
+        if wait > 0:
+            time.sleep(wait)
+        return self.session_handler.get_session()
+    
+    def _drain_session_events(self, latest: Optional[dict] = None) -> Optional[dict]:
+        """Drop queued snapshots, only the newest one matters."""
+        while True:
+            try:
+                latest = self._session_events.get_nowait()
+            except queue.Empty:
+                return latest
+    
+    def _leave_champ_select(self) -> None:
+        """Forget the finished session so the next one starts clean."""
+        self.tracker.reset()
+        self._reset_state()
+        self.latency.end_session()
+        # Re-seed from a poll next time, pushed snapshots may be stale
+        self._using_events = False
+        self._last_event_session = None
+    
+    @staticmethod
+    def _turn_start_ms(session: dict) -> float:
+        """Epoch ms at which the current timer phase began, per the client's own clock."""
+        timer = session.get("timer", {})
+        now = timer.get("internalNowInEpochMs")
+        total = timer.get("totalTimeInPhase")
+        left = timer.get("adjustedTimeLeftInPhase")
+        if now and total is not None and left is not None:
+            return now - (total - left)
+        return time.time() * 1000
+    
     def _monitor_loop(self) -> None:
         """Main monitoring loop."""
         logger.info("👀 Champion select monitor active")
@@ -472,43 +867,73 @@ class InstalockAutoban:
         logger.info(f"📋 Auto-ban: {'✅ ENABLED' if self.auto_ban.enabled else '❌ DISABLED'} - {self.get_auto_ban_status()}")
         consecutive_errors = 0
         max_errors = 10
+        wait = 0.0
         
         while self.is_running:
             try:
                 # Load champions if not loaded
                 if not self.registry.is_loaded():
-                    self.registry.load()
+                    self.registry.refresh_in_background()
                 
-                session_data = self.session_handler.get_session()
+                # Sleep until the client enters champ select
+                if self.scheduler.phase() not in CHAMP_SELECT_PHASES:
+                    self._leave_champ_select()
+                    self.scheduler.gameflow.wait_for(CHAMP_SELECT_PHASES, timeout=PHASE_GATE_TIMEOUT)
+                    wait = 0.0
+                    continue
+                
+                session_data = self._next_session(wait)
                 
                 if not session_data:
+                    self.tracker.reset()
                     self._reset_state()
                     consecutive_errors = 0
-                    time.sleep(0.5)
+                    wait = self.scheduler.champ_select_interval()
                     continue
                 
                 cell_id = self.session_handler.get_cell_id(session_data)
                 if cell_id is None:
-                    time.sleep(0.3)
+                    wait = self.scheduler.champ_select_interval()
                     continue
                 
+                index = SessionIndex(session_data, cell_id)
+                
+                changes = self.tracker.update(index)
+                
                 # Reset on new session
-                current_session_id = id(session_data)
-                if current_session_id != self._last_session_id:
+                if changes.new_session:
                     self._reset_state()
-                    self._last_session_id = current_session_id
+                    self.latency.start_session(session_data.get("gameId"))
                     logger.info("🔄 New champion select session detected")
                     logger.info(f"📋 Instalock: {'✅ ENABLED' if self.instalock.enabled else '❌ DISABLED'}")
                     logger.info(f"📋 Auto-ban: {'✅ ENABLED' if self.auto_ban.enabled else '❌ DISABLED'}")
+                elif changes.phase_changed:
+                    logger.debug(f"⏱️ Phase: {changes.phase}")
+                
+                # Keep the pick/ban choices current so our turn only has to send them
+                with self.latency.span("selection"):
+                    self.planner.update(self.instalock, self.auto_ban, self.options, index, changes)
+                
+                for action in changes.started_actions:
+                    self._turn_started[action.get("id")] = self._turn_start_ms(session_data)
+                
+                # Hover again if our hovered champion just got banned
+                if self._hovered_champion in changes.new_bans:
+                    self._pre_hover_done = False
                 
                 # Handle pre-hover
-                self._handle_pre_hover(session_data)
+                self._handle_pre_hover(index)
                 
-                # Process actions
-                self._process_actions(session_data, cell_id)
+                # Only act on turns that just started, plus ones still pending (failed or disabled)
+                actions = changes.started_actions + [
+                    action for action in index.my_actions
+                    if action.get("id") in self._pending_actions and action not in changes.started_actions
+                ]
+                if actions:
+                    self._process_actions(actions)
                 
                 consecutive_errors = 0
-                time.sleep(0.2)
+                wait = self.scheduler.champ_select_interval(index)
                 
             except Exception as e:
                 consecutive_errors += 1
@@ -519,17 +944,20 @@ class InstalockAutoban:
                     self.is_running = False
                     break
                 
-                time.sleep(1)
+                time.sleep(self.scheduler.intervals.error)
+                wait = 0.0
         
         logger.info("🛑 Champion select monitor stopped")
     
     def _reset_state(self) -> None:
         """Reset session state."""
-        self._last_session_id = None
         self._processed_actions.clear()
+        self._pending_actions.clear()
+        self._turn_started.clear()
         self._pre_hover_done = False
+        self._hovered_champion = None
     
-    def _handle_pre_hover(self, session_data: dict) -> None:
+    def _handle_pre_hover(self, index: SessionIndex) -> None:
         """Handle pre-ban hovering if enabled."""
         if not (self.options.pre_hover_enabled and 
                 self.instalock.enabled and 
@@ -537,180 +965,145 @@ class InstalockAutoban:
                 self.instalock.primary != "None"):
             return
         
-        # Get timer and phase info
-        timer = session_data.get("timer", {})
-        phase = timer.get("phase", "")
-        
-        # Check if we should hover based on phase
         # We want to hover as soon as champion select starts, before bans
-        cell_id = self.session_handler.get_cell_id(session_data)
-        if cell_id is None:
+        if index.cell_id is None:
             return
         
-        # Check if there's a pick action available for us (even if not in progress yet)
-        has_pick_action = False
-        for actions in session_data.get("actions", []):
-            if not isinstance(actions, list):
-                continue
-            
-            for action in actions:
-                if (action.get("actorCellId") == cell_id and
-                    action.get("type") == "pick" and
-                    not action.get("completed", False)):
-                    has_pick_action = True
-                    break
-            
-            if has_pick_action:
-                break
+        # Only hover if we have a pick action available (even if not in progress yet)
+        pick_action = index.pending_action("pick")
+        if pick_action is None:
+            return
         
-        # Only hover if we have a pick action available
-        if not has_pick_action:
+        # Our turn already started, the lock PATCH carries the champion so a hover is a wasted round trip
+        if index.in_progress is not None and index.in_progress.get("id") == pick_action.get("id"):
             return
         
-        # Get champion to hover
-        champ_id = self.selector.select_pick(self.instalock, session_data)
+        # Hover the head of the pick plan
+        choice = self.planner.pick.head
+        champ_id = choice.champion_id
         if champ_id != -1:
-            if self._hover_champion(champ_id):
-                champ_name = self.instalock.primary
-                if champ_name == "Random":
-                    champ_name = self.registry.get_name(champ_id)
-                logger.info(f"✨ Pre-hover successful: {champ_name.title()}")
+            if self._hover_champion(champ_id, pick_action):
+                logger.info(f"✨ Pre-hover successful: {choice.name.title()}")
                 self._pre_hover_done = True
+                self._hovered_champion = champ_id
             else:
                 logger.warning(f"⚠️ Failed to pre-hover champion")
     
-    def _hover_champion(self, champion_id: int) -> bool:
+    def _hover_champion(self, champion_id: int, pick_action: dict) -> bool:
         """
         Hover over a champion (show intent without locking).
         
         Args:
             champion_id: Champion ID to hover
+            pick_action: The local player's pending pick action
             
         Returns:
             True if successful, False otherwise
         """
         try:
-            response = self.session_handler.get_session()
-            
-            if not response:
-                return False
-            
-            cell_id = self.session_handler.get_cell_id(response)
+            action_id = pick_action.get("id")
             
-            if cell_id is None:
-                return False
+            # Hover (completed=False shows intent without locking)
+            hover_response = self.rengar.lcu_request(
+                "PATCH",
+                f"/lol-champ-select/v1/session/actions/{action_id}",
+                {"championId": champion_id, "completed": False}
+            )
             
-            # Find player's pick action
-            for actions in response.get("actions", []):
-                if not isinstance(actions, list):
-                    continue
-                
-                for action in actions:
-                    if (action.get("actorCellId") == cell_id and
-                        action.get("type") == "pick" and
-                        not action.get("completed", False)):
-                        
-                        action_id = action.get("id")
-                        
-                        # Hover (completed=False shows intent without locking)
-                        hover_response = self.rengar.lcu_request(
-                            "PATCH",
-                            f"/lol-champ-select/v1/session/actions/{action_id}",
-                            {"championId": champion_id, "completed": False}
-                        )
-                        
-                        if hover_response.status_code in [204, 200]:
-                            return True
-            
-            return False
+            return hover_response.status_code in [204, 200]
             
         except Exception as e:
             logger.error(f"❌ Error hovering champion: {e}")
             return False
     
-    def _process_actions(self, session_data: dict, cell_id: int) -> None:
-        """Process champion select actions."""
-        for actions in session_data.get("actions", []):
-            if not isinstance(actions, list):
+    def _process_actions(self, actions: List[dict]) -> None:
+        """Process the local player's champion select actions."""
+        for action in actions:
+            action_id = action.get("id")
+            action_type = action.get("type")
+            is_in_progress = action.get("isInProgress", False)
+            is_completed = action.get("completed", False)
+            
+            # Debug logging
+            logger.debug(f"🔍 Action {action_id}: type={action_type}, inProgress={is_in_progress}, completed={is_completed}")
+            
+            # Skip if already processed or completed
+            if action_id in self._processed_actions:
                 continue
             
-            for action in actions:
-                # Only process our own actions
-                if action.get("actorCellId") != cell_id:
-                    continue
-                
-                action_id = action.get("id")
-                action_type = action.get("type")
-                is_in_progress = action.get("isInProgress", False)
-                is_completed = action.get("completed", False)
-                
-                # Debug logging
-                logger.debug(f"🔍 Action {action_id}: type={action_type}, inProgress={is_in_progress}, completed={is_completed}")
-                
-                # Skip if already processed or completed
-                if action_id in self._processed_actions:
-                    continue
-                
-                if is_completed:
-                    self._processed_actions.add(action_id)
-                    continue
-                
-                # Check if action is available (isInProgress=True means it's our turn)
-                if not is_in_progress:
-                    continue
-                
-                # Process based on action type and enabled features
-                if action_type == "pick":
-                    if self.instalock.enabled:
-                        logger.info("🎯 Processing PICK action")
-                        self._execute_pick(action_id, session_data)
-                    else:
-                        logger.debug("⏭️ Skipping pick - instalock disabled")
-                        
-                elif action_type == "ban":
-                    if self.auto_ban.enabled:
-                        logger.info("🎯 Processing BAN action")
-                        self._execute_ban(action_id, session_data, cell_id)
-                    else:
-                        logger.debug("⏭️ Skipping ban - auto-ban disabled")
-    
-    def _execute_pick(self, action_id: int, session_data: dict) -> None:
+            if is_completed:
+                self._processed_actions.add(action_id)
+                continue
+            
+            # Check if action is available (isInProgress=True means it's our turn)
+            if not is_in_progress:
+                continue
+            
+            # Process based on action type and enabled features
+            if action_type == "pick":
+                if self.instalock.enabled:
+                    logger.info("🎯 Processing PICK action")
+                    self._execute_pick(action_id)
+                else:
+                    self._pending_actions.add(action_id)
+                    logger.debug("⏭️ Skipping pick - instalock disabled")
+                    
+            elif action_type == "ban":
+                if self.auto_ban.enabled:
+                    logger.info("🎯 Processing BAN action")
+                    self._execute_ban(action_id)
+                else:
+                    self._pending_actions.add(action_id)
+                    logger.debug("⏭️ Skipping ban - auto-ban disabled")
+    
+    def _execute_pick(self, action_id: int) -> None:
         """Execute pick action."""
-        champ_id = self.selector.select_pick(self.instalock, session_data)
-        if champ_id != -1:
-            self._complete_action(action_id, champ_id, "pick")
+        choice = self.planner.pick.head
+        if choice.champion_id == -1:
+            # Keep the turn pending, a config change or a registry load can still fill the plan
+            if action_id not in self._pending_actions:
+                logger.error("🚫 All pick options unavailable!")
+            self._pending_actions.add(action_id)
+            return
+        
+        self._complete_action(action_id, choice.champion_id, "pick")
     
-    def _execute_ban(self, action_id: int, session_data: dict, cell_id: int) -> None:
+    def _execute_ban(self, action_id: int) -> None:
         """Execute ban action."""
-        logger.info(f"🎯 Attempting to ban champion (action_id: {action_id})")
-        champ_id = self.selector.select_ban(
-            self.auto_ban, 
-            session_data, 
-            cell_id, 
-            self.options.avoid_ally_hovers
-        )
-        if champ_id != -1:
-            self._complete_action(action_id, champ_id, "ban")
-        else:
-            logger.warning("⚠️ No valid champion to ban found")
+        choice = self.planner.ban.head
+        if choice.champion_id == -1:
+            # Keep the turn pending, a config change or a registry load can still fill the plan
+            if action_id not in self._pending_actions:
+                logger.error("🚫 All ban options unavailable!")
+            self._pending_actions.add(action_id)
+            return
+        
+        self._complete_action(action_id, choice.champion_id, "ban")
     
     def _complete_action(self, action_id: int, champion_id: int, action_type: str) -> None:
         """Complete a champion select action."""
         try:
-            response = self.rengar.lcu_request(
-                "PATCH",
-                f"/lol-champ-select/v1/session/actions/{action_id}",
-                {"completed": True, "championId": champion_id}
-            )
+            with self.latency.span("patch"):
+                response = self.rengar.lcu_request(
+                    "PATCH",
+                    f"/lol-champ-select/v1/session/actions/{action_id}",
+                    {"completed": True, "championId": champion_id}
+                )
             
             if response.status_code in [204, 200]:
+                turn_started = self._turn_started.pop(action_id, None)
+                if turn_started is not None:
+                    self.latency.record("turn_to_lock", time.time() * 1000 - turn_started)
                 self._processed_actions.add(action_id)
+                self._pending_actions.discard(action_id)
                 champ_name = self.registry.get_name(champion_id)
                 logger.info(f"✅ {action_type.title()} completed: {champ_name}")
             else:
+                self._pending_actions.add(action_id)
                 logger.warning(f"⚠️ Failed to {action_type}: {response.status_code}")
                 
         except Exception as e:
+            self._pending_actions.add(action_id)
             logger.error(f"❌ Error completing {action_type}: {e}")
     
     # Status methods
@@ -773,9 +1166,14 @@ class InstalockAutoban:
                 "running": self.is_running,
                 "thread_alive": self.monitor_thread.is_alive() if self.monitor_thread else False
             },
-            "champions_loaded": len(self.registry._champ_dict)
+            "champions_loaded": self.registry.count(),
+            "latency": self.get_latency_stats()
         }
     
+    def get_latency_stats(self) -> dict:
+        """Per-stage p50/p95/p99 (ms) for the current session, recent sessions and overall."""
+        return self.latency.report()
+    
     def __del__(self):
         """Cleanup when object is destroyed."""
         self.stop()
\ No newline at end of file
@@ -0,0 +1,207 @@
+"""
+LCU WebSocket (WAMP) event client - pushes client state changes instead of polling.
+"""
+
+import json
+import ssl
+import threading
+import time
+import logging
+from typing import Callable, Dict, List, Optional
+
+from Rengar import Rengar, credentials
+
+try:
+    import websocket
+except ImportError:  # websocket-client missing, monitors fall back to polling
+    websocket = None
+
+logger = logging.getLogger(__name__)
+
+# WAMP 1.0 message types used by the LCU
+WAMP_SUBSCRIBE = 5
+WAMP_EVENT = 8
+
+CHAMP_SELECT_SESSION_EVENT = "OnJsonApiEvent_lol-champ-select_v1_session"
+READY_CHECK_EVENT = "OnJsonApiEvent_lol-matchmaking_v1_ready-check"
+GAMEFLOW_PHASE_EVENT = "OnJsonApiEvent_lol-gameflow_v1_gameflow-phase"
+CHAT_SESSION_EVENT = "OnJsonApiEvent_chat_v1_session"
+
+EventCallback = Callable[[dict], None]
+
+
+class LCUEventClient:
+    """Keeps one WebSocket to the LCU open and dispatches subscribed events to callbacks."""
+
+    def __init__(self, rengar=None, reconnect_delay: float = 1.0, max_reconnect_delay: float = 10.0):
+        self.rengar = rengar or Rengar()
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+
+        self._callbacks: Dict[str, List[EventCallback]] = {}
+        self._lock = threading.Lock()
+        self._ws = None
+        self._connected = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.is_running = False
+
+    @staticmethod
+    def is_available() -> bool:
+        """Check if the websocket-client dependency is installed."""
+        return websocket is not None
+
+    def is_connected(self) -> bool:
+        """Check if events are currently being received."""
+        return self._connected.is_set()
+
+    def wait_connected(self, timeout: float) -> bool:
+        """Wait until the socket is connected and subscribed."""
+        return self._connected.wait(timeout)
+
+    def subscribe(self, event: str, callback: EventCallback) -> None:
+        """Call callback with the event payload ({data, eventType, uri}) for every event."""
+        with self._lock:
+            first = event not in self._callbacks
+            self._callbacks.setdefault(event, []).append(callback)
+            ws = self._ws if first else None
+
+        # Sockets connected later subscribe to every registered event themselves
+        if ws is not None:
+            self._send_subscribe(ws, event)
+
+    def unsubscribe(self, event: str, callback: EventCallback) -> None:
+        """Stop calling callback for event."""
+        with self._lock:
+            callbacks = self._callbacks.get(event, [])
+            if callback in callbacks:
+                callbacks.remove(callback)
+
+    def start(self) -> bool:
+        """Start the event thread. Returns False if websocket-client is not installed."""
+        if not self.is_available():
+            logger.warning("⚠️ websocket-client not installed, LCU events disabled")
+            return False
+
+        if self._thread is None or not self._thread.is_alive():
+            self.is_running = True
+            self._thread = threading.Thread(target=self._run, daemon=True, name="LCUEvents")
+            self._thread.start()
+        return True
+
+    def stop(self) -> None:
+        """Close the socket and stop the event thread."""
+        self.is_running = False
+        self._connected.clear()
+        ws = self._ws
+        if ws is not None:
+            try:
+                ws.close()
+            except Exception:
+                pass
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=2)
+
+    def _socket_url(self) -> str:
+        scheme = "ws" if self.rengar.leagueUrl.startswith("http://") else "wss"
+        return f"{scheme}://127.0.0.1:{self.rengar.leaguePort}/"
+
+    def _send_subscribe(self, ws, event: str) -> None:
+        try:
+            ws.send(json.dumps([WAMP_SUBSCRIBE, event]))
+        except Exception as e:
+            logger.debug(f"Subscribe to {event} failed: {e}")
+
+    def _connect(self):
+        self.rengar.update_league_credentials()
+        if self.rengar.leaguePort is None:
+            return None
+
+        ws = websocket.create_connection(
+            self._socket_url(),
+            header=[f"Authorization: {self.rengar.leagueHeaders['Authorization']}"],
+            sslopt={"cert_reqs": ssl.CERT_NONE, "check_hostname": False},
+            timeout=5,
+        )
+        # Block on recv so idle sockets do not spin; stop() closes the socket to wake it
+        ws.settimeout(None)
+        return ws
+
+    def _run(self) -> None:
+        delay = self.reconnect_delay
+
+        while self.is_running:
+            try:
+                ws = self._connect()
+            except Exception as e:
+                logger.debug(f"LCU event socket connect failed: {e}")
+                credentials.invalidate_league((self.rengar.leaguePort, self.rengar.leagueToken))
+                ws = None
+
+            if ws is None:
+                time.sleep(delay)
+                delay = min(delay * 2, self.max_reconnect_delay)
+                continue
+
+            with self._lock:
+                self._ws = ws
+                events = list(self._callbacks)
+                self._connected.set()
+            for event in events:
+                self._send_subscribe(ws, event)
+
+            delay = self.reconnect_delay
+            logger.info("🔌 LCU event socket connected")
+
+            try:
+                self._receive(ws)
+            except Exception as e:
+                if self.is_running:
+                    logger.warning(f"⚠️ LCU event socket closed: {e}")
+            finally:
+                self._connected.clear()
+                with self._lock:
+                    self._ws = None
+                try:
+                    ws.close()
+                except Exception:
+                    pass
+
+    def _receive(self, ws) -> None:
+        while self.is_running:
+            message = ws.recv()
+            if not message:
+                continue
+
+            try:
+                frame = json.loads(message)
+            except ValueError:
+                continue
+
+            if not isinstance(frame, list) or len(frame) < 3 or frame[0] != WAMP_EVENT:
+                continue
+
+            self._dispatch(frame[1], frame[2])
+
+    def _dispatch(self, event: str, payload: dict) -> None:
+        with self._lock:
+            callbacks = list(self._callbacks.get(event, []))
+
+        for callback in callbacks:
+            try:
+                callback(payload)
+            except Exception as e:
+                logger.error(f"❌ Error in {event} handler: {e}")
+
+
+_event_client: Optional[LCUEventClient] = None
+_event_client_lock = threading.Lock()
+
+
+def get_event_client() -> LCUEventClient:
+    """Return the process-wide event client, starting it on first use."""
+    global _event_client
+    with _event_client_lock:
+        if _event_client is None:
+            _event_client = LCUEventClient()
+            _event_client.start()
+        return _event_client
@@ -0,0 +1,105 @@
+"""
+In-process latency spans with percentile summaries.
+"""
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Dict, Iterator, List, Optional
+
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(sorted_samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_samples:
+        return 0.0
+    rank = max(1, -(-len(sorted_samples) * pct // 100))
+    return sorted_samples[int(rank) - 1]
+
+
+class StageHistogram:
+    """Latency samples (ms) per stage, bounded so long sessions stay cheap."""
+
+    def __init__(self, max_samples: int = 1000):
+        self.max_samples = max_samples
+        self._samples: Dict[str, Deque[float]] = {}
+
+    def record(self, stage: str, ms: float) -> None:
+        samples = self._samples.get(stage)
+        if samples is None:
+            samples = self._samples[stage] = deque(maxlen=self.max_samples)
+        samples.append(ms)
+
+    def summary(self) -> Dict[str, dict]:
+        """{stage: {count, p50, p95, p99, max}} with values in milliseconds."""
+        result = {}
+        for stage, samples in self._samples.items():
+            ordered = sorted(samples)
+            stats = {"count": len(ordered)}
+            for pct in PERCENTILES:
+                stats[f"p{pct}"] = round(percentile(ordered, pct), 3)
+            stats["max"] = round(ordered[-1], 3) if ordered else 0.0
+            result[stage] = stats
+        return result
+
+
+class LatencyTracker:
+    """Collects timing spans for the current session, past sessions and overall."""
+
+    def __init__(self, history: int = 10, max_samples: int = 1000):
+        self.max_samples = max_samples
+        self._lock = threading.Lock()
+        self._overall = StageHistogram(max_samples)
+        self._session: Optional[StageHistogram] = None
+        self._session_key = None
+        self._history: Deque[dict] = deque(maxlen=history)
+
+    def start_session(self, key) -> None:
+        """Close the current session's histogram and start a new one."""
+        with self._lock:
+            self._close_session()
+            self._session_key = key
+            self._session = StageHistogram(self.max_samples)
+
+    def end_session(self) -> None:
+        """Move the current session into the history."""
+        with self._lock:
+            self._close_session()
+
+    def _close_session(self) -> None:
+        if self._session is not None:
+            summary = self._session.summary()
+            if summary:
+                self._history.append({"session": self._session_key, "stages": summary})
+        self._session = None
+        self._session_key = None
+
+    def record(self, stage: str, ms: float) -> None:
+        """Add one sample in milliseconds."""
+        with self._lock:
+            self._overall.record(stage, ms)
+            if self._session is not None:
+                self._session.record(stage, ms)
+
+    @contextmanager
+    def span(self, stage: str) -> Iterator[None]:
+        """Time the with-block as one sample of stage."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, (time.perf_counter() - start) * 1000)
+
+    def report(self) -> dict:
+        """Percentiles for the current session, recent sessions and everything since start."""
+        with self._lock:
+            return {
+                "current": {
+                    "session": self._session_key,
+                    "stages": self._session.summary() if self._session else {},
+                },
+                "sessions": list(self._history),
+                "overall": self._overall.summary(),
+            }
@@ -0,0 +1,122 @@
+"""
+In-memory cache for the profile endpoints behind the summoner dashboard.
+"""
+
+import threading
+import time
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from Rengar import Rengar, credentials
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ProfileEndpoint:
+    path: str
+    ttl: float
+
+
+# Region never changes mid-session, rank and level only after a game
+PROFILE_ENDPOINTS: Dict[str, ProfileEndpoint] = {
+    "summoner": ProfileEndpoint("/lol-summoner/v1/current-summoner", 300.0),
+    "region": ProfileEndpoint("/riotclient/region-locale", 24 * 3600.0),
+    "ranked": ProfileEndpoint("/lol-ranked/v1/current-ranked-stats", 600.0),
+}
+
+# Entries refreshed when a game ends
+END_OF_GAME_PHASES = ("PreEndOfGame", "EndOfGame")
+END_OF_GAME_ENTRIES = ("summoner", "ranked")
+
+
+@dataclass
+class _Entry:
+    data: Any
+    fetched: float
+
+
+class ProfileCache:
+    """Serves profile data from memory and fetches only stale entries, concurrently."""
+
+    def __init__(self, rengar=None, endpoints: Optional[Dict[str, ProfileEndpoint]] = None):
+        self.rengar = rengar or Rengar()
+        self.endpoints = endpoints or PROFILE_ENDPOINTS
+
+        self._entries: Dict[str, _Entry] = {}
+        self._identity = None
+        self._puuid = None
+        self._lock = threading.Lock()
+
+    def get(self, *names: str) -> Dict[str, Any]:
+        """
+        Return {name: decoded JSON} for the requested entries (all when none given).
+
+        Stale entries are fetched in one concurrent batch. A failed fetch keeps the previous
+        value if there is one, otherwise the entry is None.
+        """
+        names = names or tuple(self.endpoints)
+        now = time.monotonic()
+
+        with self._lock:
+            # A restarted client (new lockfile credentials) invalidates everything. The shared
+            # provider rechecks the lockfile, our Rengar only notices after a failed request
+            identity = credentials.league()
+            if identity != self._identity:
+                self._entries.clear()
+                self._identity = identity
+                self.rengar.update_league_credentials()
+
+            stale = [
+                name for name in names
+                if name not in self._entries
+                or now - self._entries[name].fetched >= self.endpoints[name].ttl
+            ]
+
+        if stale:
+            responses = self.rengar.lcu_gather([("GET", self.endpoints[name].path, "") for name in stale])
+            fetched = time.monotonic()
+            with self._lock:
+                for name, response in zip(stale, responses):
+                    if response.status_code == 200:
+                        self._entries[name] = _Entry(response.json(), fetched)
+                    else:
+                        logger.debug(f"Profile {name} fetch failed: {response.status_code}")
+
+                # Another account on the same client, entries from the previous one are dropped
+                switched = self._account_switched(stale)
+                if switched:
+                    for name in list(self._entries):
+                        if name not in stale:
+                            del self._entries[name]
+            if switched:
+                return self.get(*names)
+
+        with self._lock:
+            return {name: self._entries[name].data if name in self._entries else None for name in names}
+
+    def _account_switched(self, fetched) -> bool:
+        summoner = self._entries.get("summoner") if "summoner" in fetched else None
+        if summoner is None or not isinstance(summoner.data, dict):
+            return False
+        puuid = summoner.data.get("puuid")
+        switched = self._puuid is not None and puuid != self._puuid
+        self._puuid = puuid
+        return switched
+
+    def invalidate(self, *names: str) -> None:
+        """Drop the given entries (all when none given) so the next get refetches them."""
+        with self._lock:
+            if not names:
+                self._entries.clear()
+            for name in names:
+                self._entries.pop(name, None)
+
+    def watch_gameflow(self, gameflow) -> None:
+        """Refresh level and rank after every game."""
+        def on_phase(old: str, new: str) -> None:
+            if new in END_OF_GAME_PHASES:
+                self.invalidate(*END_OF_GAME_ENTRIES)
+
+        gameflow.on_change(on_phase)
@@ -1,3 +1,6 @@
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from time import sleep
 
 from termcolor import colored
@@ -6,6 +9,95 @@ from Rengar import Rengar
 
 rengar = Rengar()
 
+# Status codes worth retrying: rate limited or the client is busy
+RETRY_STATUS = {429, 500, 502, 503, 504}
+MAX_WORKERS = 8
+MAX_RETRIES = 3
+BACKOFF = 0.5
+
+
+def get_friends():
+    """Return the friend list, None if it could not be fetched"""
+    response = rengar.lcu_request("GET", "/lol-chat/v1/friends", "")
+    if response.status_code != 200:
+        return None
+    return response.json()
+
+
+def friend_display_name(friend):
+    game_name = friend.get("gameName") or friend.get("name") or ""
+    game_tag = friend.get("gameTag", "")
+    return f"{game_name}#{game_tag}" if game_tag else game_name
+
+
+def friend_filter(group=None, name_pattern=None, offline_days=None):
+    """Build a predicate matching friends by group, name regex and days since last online"""
+    pattern = re.compile(name_pattern, re.IGNORECASE) if name_pattern else None
+
+    def predicate(friend):
+        if group is not None and (friend.get("groupName") or "").lower() != group.lower():
+            return False
+        if pattern is not None and not pattern.search(friend_display_name(friend)):
+            return False
+        if offline_days is not None:
+            if friend.get("availability", "offline") != "offline":
+                return False
+            last_seen = friend.get("lastSeenOnlineTimestamp")
+            # No timestamp means the client never saw them online
+            if last_seen:
+                offline_for = time.time() - int(last_seen) / 1000
+                if offline_for < offline_days * 86400:
+                    return False
+        return True
+
+    return predicate
+
+
+def delete_friend(friend, max_retries=MAX_RETRIES, backoff=BACKOFF):
+    """Delete one friend, retrying with backoff on 429/5xx. Returns a result dict"""
+    friend_id = friend.get("pid")
+    result = {"pid": friend_id, "name": friend_display_name(friend), "success": False}
+
+    for attempt in range(1, max_retries + 2):
+        result["attempts"] = attempt
+        try:
+            response = rengar.lcu_request("DELETE", f"/lol-chat/v1/friends/{friend_id}", "")
+        except Exception as e:
+            result["error"] = str(e)
+            return result
+
+        result["status"] = response.status_code
+        if response.status_code in [200, 204]:
+            result["success"] = True
+            return result
+        if response.status_code not in RETRY_STATUS or attempt > max_retries:
+            return result
+
+        retry_after = response.headers.get("Retry-After", "")
+        delay = float(retry_after) if retry_after.isdigit() else backoff * 2 ** (attempt - 1)
+        sleep(delay)
+
+    return result
+
+
+def iter_remove_friends(friends, predicate=None, dry_run=False, max_workers=MAX_WORKERS):
+    """Remove friends on a bounded worker pool, yielding each result as it completes
+
+    With dry_run the matching friends are yielded without being deleted.
+    """
+    targets = [f for f in friends if predicate is None or predicate(f)]
+
+    if dry_run:
+        for friend in targets:
+            yield {"pid": friend.get("pid"), "name": friend_display_name(friend),
+                   "success": True, "dryRun": True}
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="RemoveFriends") as pool:
+        futures = [pool.submit(delete_friend, friend) for friend in targets]
+        for future in as_completed(futures):
+            yield future.result()
+
 
 def remove_all_friends():
     try:
@@ -22,21 +114,12 @@ def remove_all_friends():
             removed_count = 0
             failed_count = 0
 
-            for friend in friends:
-                friend_id = friend.get("pid")
-
-                try:
-                    delete_response = rengar.lcu_request(
-                        "DELETE", f"/lol-chat/v1/friends/{friend_id}", ""
-                    )
-
-                    if delete_response.status_code in [200, 204]:
-                        removed_count += 1
-                    else:
-                        failed_count += 1
-
-                except Exception as e:
+            for result in iter_remove_friends(friends):
+                if result["success"]:
+                    removed_count += 1
+                else:
                     failed_count += 1
+                    print(colored(f"Failed to remove {result['name']}", "red"))
 
             print(colored(f"\nRemoved {removed_count} friend(s)", "green"))
             if failed_count > 0:
@@ -4,53 +4,221 @@ import psutil
 import requests
 import base64
 import json
+import os
+import sys
+import threading
 import urllib3
-from time import sleep
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from time import monotonic, sleep
 
 urllib3.disable_warnings()
 
+HTTP_METHODS = ("GET", "POST", "PUT", "DELETE", "PATCH")
+
+# Enough keep-alive connections for the monitor threads plus a few parallel calls
+POOL_SIZE = 16
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+# Runs concurrent requests over the pooled sessions, one worker per pooled connection
+_executor = ThreadPoolExecutor(max_workers=POOL_SIZE, thread_name_prefix='Rengar')
+
+# Set LTK_LEAGUE_DIR when League is installed somewhere else
+LEAGUE_DIR_ENV = 'LTK_LEAGUE_DIR'
+
+if sys.platform == 'darwin':
+    DEFAULT_LEAGUE_DIRS = ['/Applications/League of Legends.app/Contents/LoL']
+else:
+    DEFAULT_LEAGUE_DIRS = [r'C:\Riot Games\League of Legends']
+
+
+CLIENT_PROCESS_NAMES = ('LeagueClientUx.exe', 'LeagueClientUx')
+
+# A Riot client lookup that found nothing is not repeated for this long
+RIOT_RESCAN_INTERVAL = 5.0
+
+_client_pid = None
+
+
+def _parse_client_args(cmdline):
+    args = {}
+    for arg in cmdline or []:
+        if arg.startswith('--') and '=' in arg:
+            key, value = arg[2:].split('=', 1)
+            args[key] = value
+    return args
+
+
+def _client_args_for_pid(pid):
+    """Return the client arguments of pid, None if it is gone or not the client"""
+    try:
+        proc = psutil.Process(pid)
+        if proc.name() not in CLIENT_PROCESS_NAMES:
+            return None
+        args = _parse_client_args(proc.cmdline())
+    except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+        return None
+    return args if 'app-port' in args else None
+
+
+def find_client_args():
+    """Return the LeagueClientUx command line arguments as a dict, None if not running
+
+    The last matching pid is rechecked first. Otherwise processes are listed by
+    name only and the cmdline is read just for LeagueClientUx candidates.
+    """
+    global _client_pid
+    if _client_pid is not None:
+        args = _client_args_for_pid(_client_pid)
+        if args is not None:
+            return args
+        _client_pid = None
+
+    for proc in psutil.process_iter(['name']):
+        if proc.info['name'] not in CLIENT_PROCESS_NAMES:
+            continue
+        args = _client_args_for_pid(proc.pid)
+        if args is not None:
+            _client_pid = proc.pid
+            return args
+    return None
+
+
+def read_lockfile(path):
+    """Parse a League lockfile (name:pid:port:password:protocol), None if unreadable"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            parts = f.read().strip().split(':')
+    except OSError:
+        return None
+    if len(parts) != 5:
+        return None
+    name, pid, port, password, protocol = parts
+    return {
+        'name': name,
+        'pid': int(pid) if pid.isdigit() else None,
+        'port': port,
+        'password': password,
+        'protocol': protocol,
+    }
+
+
+class CredentialProvider:
+    """Discovers the client credentials once per process and shares them with every Rengar"""
+
+    def __init__(self, install_dir=None):
+        self._lock = threading.Lock()
+        self._league = None
+        self._league_protocol = 'https'
+        self._riot = None
+        self._riot_missed = None
+        self._install_dir = install_dir or os.environ.get(LEAGUE_DIR_ENV)
+        self._lockfile_mtime = None
+
+    def set_install_dir(self, install_dir):
+        """Point lockfile discovery at a League install directory"""
+        with self._lock:
+            self._install_dir = install_dir
+            self._lockfile_mtime = None
+
+    def _lockfile_paths(self):
+        dirs = [self._install_dir] if self._install_dir else DEFAULT_LEAGUE_DIRS
+        return [os.path.join(d, 'lockfile') for d in dirs]
+
+    def _league_from_lockfile(self):
+        """Refresh from the lockfile when it changed, True if it holds the credentials"""
+        for path in self._lockfile_paths():
+            try:
+                mtime = os.path.getmtime(path)
+            except OSError:
+                continue
+            if self._league is not None and mtime == self._lockfile_mtime:
+                return True
+            info = read_lockfile(path)
+            # A crashed client can leave its lockfile behind
+            if info is None or (info['pid'] and not psutil.pid_exists(info['pid'])):
+                continue
+            self._league = (info['port'], info['password'])
+            self._league_protocol = info['protocol'] or 'https'
+            self._lockfile_mtime = mtime
+            return True
+        self._lockfile_mtime = None
+        return False
+
+    def _scan(self):
+        """Fill both credential pairs from a single process lookup"""
+        args = find_client_args()
+        if args is None:
+            return
+        league = (args.get('app-port'), args.get('remoting-auth-token'))
+        riot = (args.get('riotclient-app-port'), args.get('riotclient-auth-token'))
+        if self._league is None and None not in league:
+            self._league = league
+            self._league_protocol = 'https'
+        if self._riot is None and None not in riot:
+            self._riot = riot
+        # Remember where the client lives so the next lookup reads the lockfile
+        if not self._install_dir:
+            self._install_dir = args.get('install-directory')
+
+    def league(self):
+        with self._lock:
+            if self._league_from_lockfile():
+                return self._league
+            if self._league is None:
+                self._scan()
+            return self._league or (None, None)
+
+    def league_protocol(self):
+        return self._league_protocol
+
+    def riot(self):
+        with self._lock:
+            if self._riot is None:
+                if self._riot_missed is not None and monotonic() - self._riot_missed < RIOT_RESCAN_INTERVAL:
+                    return None, None
+                self._scan()
+                self._riot_missed = None if self._riot is not None else monotonic()
+            return self._riot or (None, None)
+
+    def invalidate_league(self, stale=None):
+        """Forget the LCU credentials, or only if they still equal the stale pair"""
+        with self._lock:
+            if stale is None or self._league == stale:
+                self._league = None
+                self._lockfile_mtime = None
+
+    def invalidate_riot(self, stale=None):
+        """Forget the Riot client credentials, or only if they still equal the stale pair"""
+        with self._lock:
+            if stale is None or self._riot == stale:
+                self._riot = None
+                self._riot_missed = None
+
+    def invalidate(self):
+        with self._lock:
+            self._league = None
+            self._lockfile_mtime = None
+            self._riot = None
+            self._riot_missed = None
+
+
+credentials = CredentialProvider()
 
-def find_league_client_credentials():
-    for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
-        if proc.info['name'] == 'LeagueClientUx.exe':
-            cmdline = proc.info['cmdline']
-            port = None
-            token = None
-            for arg in cmdline:
-                if arg.startswith('--app-port='):
-                    port = arg.split('=')[1]
-                elif arg.startswith('--remoting-auth-token='):
-                    token = arg.split('=')[1]
-            if port and token:
-                return port, token
-    return None, None
 
 def check_league_client():
     while True:
-        port_check, token_check = find_league_client_credentials()
+        port_check, token_check = credentials.league()
         if port_check == None and token_check == None:
             sleep(0.5)
         else:
             return port_check, token_check
 
 
-def find_riot_client_credentials():
-    port = None
-    token = None
-    for process in psutil.process_iter(attrs=['pid', 'name', 'cmdline']):
-        if 'LeagueClientUx' in process.info['name']:
-            for arg in process.info['cmdline']:
-                if '--riotclient-auth-token=' in arg:
-                    token = arg.split('=')[1]
-                if '--riotclient-app-port=' in arg:
-                    port = arg.split('=')[1]
-            if token and port:
-                break
-    return port, token
-
-
-def return_lcu_url(leaguePort):
-    url = f'https://127.0.0.1:{str(leaguePort)}'
+def return_lcu_url(leaguePort, protocol='https'):
+    url = f'{protocol}://127.0.0.1:{str(leaguePort)}'
     return str(url)
 
 
@@ -77,83 +245,99 @@ def return_lcu_headers(leagueToken):
     return headers
 
 
+def get_session(url, headers):
+    """Return the shared keep-alive session for a client url and auth headers"""
+    key = (url, headers.get('Authorization'))
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(headers)
+            # Also passed per request: REQUESTS_CA_BUNDLE in the environment overrides this
+            session.verify = False
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POOL_SIZE)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            _sessions[key] = session
+        return session
+
+
+def encode_body(body):
+    if body == "" or body is None:
+        return None
+    return json.dumps(body)
+
+
 class Rengar:
     def __init__(self):
         self.update_league_credentials()
-        self.update_riot_credentials()
+        # The Riot client is only needed by a few features, resolved on the first riot request
+        self.riotPort = self.riotToken = self.riotUrl = None
+        self.riotHeaders = self.riotSession = None
 
     def update_league_credentials(self):
-        self.leaguePort, self.leagueToken = find_league_client_credentials()
-        self.leagueUrl = return_lcu_url(self.leaguePort)
+        self.leaguePort, self.leagueToken = credentials.league()
+        self.leagueUrl = return_lcu_url(self.leaguePort, credentials.league_protocol())
         self.leagueHeaders = return_lcu_headers(self.leagueToken)
-
-
+        self.leagueSession = get_session(self.leagueUrl, self.leagueHeaders)
 
     def update_riot_credentials(self):
-        self.riotPort, self.riotToken = find_riot_client_credentials()
+        self.riotPort, self.riotToken = credentials.riot()
         self.riotUrl = return_riot_url(self.riotPort)
         self.riotHeaders = return_riot_headers(self.riotToken)
+        self.riotSession = get_session(self.riotUrl, self.riotHeaders)
 
     def return_lcu_creds(self):
         return self.leaguePort, self.leagueToken, self.leagueUrl
 
     def return_riot_creds(self):
+        if self.riotSession is None:
+            self.update_riot_credentials()
         return self.riotPort, self.riotToken, self.riotUrl
 
     def lcu_request(self, method, endpoint, body: dict):
         method = method.upper()
-        url = f'{self.leagueUrl}{endpoint}'
-        if body == "":
-            body = None
-        elif body is not None:
-            body = json.dumps(body)
+        if method not in HTTP_METHODS:
+            raise ValueError('Invalid method')
+        data = encode_body(body)
 
+        # verify=False per request, REQUESTS_CA_BUNDLE/CURL_CA_BUNDLE would override session.verify
         try:
-            if method == "GET":
-                req = requests.get(url, headers=self.leagueHeaders, data=body, verify=False)
-            elif method == "POST":
-                req = requests.post(url, headers=self.leagueHeaders, data=body, verify=False)
-            elif method == "PUT":
-                req = requests.put(url, headers=self.leagueHeaders, data=body, verify=False)
-            elif method == "DELETE":
-                req = requests.delete(url, headers=self.leagueHeaders, data=body, verify=False)
-            elif method == "PATCH":
-                req = requests.patch(url, headers=self.leagueHeaders, data=body, verify=False)
-            else:
-                raise ValueError('Invalid method')
-
-            return req
-        except requests.exceptions.RequestException as e:
+            return self.leagueSession.request(method, f'{self.leagueUrl}{endpoint}', data=data, verify=False)
+        except requests.exceptions.RequestException:
+            credentials.invalidate_league((self.leaguePort, self.leagueToken))
             check_league_client()
             self.update_league_credentials()
-            req = self.lcu_request(method, endpoint, body)
-            return req
+
+        # One retry with fresh credentials, a second failure goes to the caller
+        return self.leagueSession.request(method, f'{self.leagueUrl}{endpoint}', data=data, verify=False)
 
     def riot_request(self, method, endpoint, body: dict):
         method = method.upper()
-        url = f'{self.riotUrl}{endpoint}'
-        if body == "":
-            body = None
-        
-        if body is not None:
-            body = json.dumps(body)
+        if method not in HTTP_METHODS:
+            raise ValueError('Invalid method')
+        data = encode_body(body)
+        if self.riotSession is None:
+            self.update_riot_credentials()
 
+        # verify=False per request, REQUESTS_CA_BUNDLE/CURL_CA_BUNDLE would override session.verify
         try:
-            if method == "GET":
-                req = requests.get(url, headers=self.riotHeaders, data=body, verify=False)
-            elif method == "POST":
-                req = requests.post(url, headers=self.riotHeaders, data=body, verify=False)
-            elif method == "PUT":
-                req = requests.put(url, headers=self.riotHeaders, data=body, verify=False)
-            elif method == "DELETE":
-                req = requests.delete(url, headers=self.riotHeaders, data=body, verify=False)
-            elif method == "PATCH":
-                req = requests.patch(url, headers=self.riotHeaders, data=body, verify=False)
-            else:
-                raise ValueError('Invalid method')
-
-            return req
-        except requests.exceptions.RequestException as e:
+            return self.riotSession.request(method, f'{self.riotUrl}{endpoint}', data=data, verify=False)
+        except requests.exceptions.RequestException:
+            credentials.invalidate_riot((self.riotPort, self.riotToken))
             check_league_client()
             self.update_riot_credentials()
-            return self.riot_request(method, endpoint, body)
\ No newline at end of file
+
+        # One retry with fresh credentials, a second failure goes to the caller
+        return self.riotSession.request(method, f'{self.riotUrl}{endpoint}', data=data, verify=False)
+
+    def lcu_gather(self, requests_list):
+        """Send (method, endpoint, body) requests concurrently, responses in the same order"""
+        futures = [_executor.submit(self.lcu_request, *request) for request in requests_list]
+        return [future.result() for future in futures]
+
+    def riot_gather(self, requests_list):
+        """Send (method, endpoint, body) requests to the Riot client concurrently"""
+        futures = [_executor.submit(self.riot_request, *request) for request in requests_list]
+        return [future.result() for future in futures]
+
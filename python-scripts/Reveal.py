@@ -1,4 +1,6 @@
+import json
 import webbrowser
+from urllib.parse import quote
 from Rengar import Rengar
 from termcolor import colored
 
@@ -7,12 +9,52 @@ class ChampionSelectNotFoundError(Exception):
     pass
 
 
+# Region does not change while the client is open, keyed by the client's (port, token)
+# so a restart or an account switch fetches it again
+_region_cache = {}
+
+
+def _cache_region(identity, region):
+    _region_cache.clear()
+    _region_cache[identity] = region
+
+
+def _get_summoners(rengar, summoner_ids):
+    """Resolve summoner ids with one batch call, falling back to concurrent single lookups"""
+    if not summoner_ids:
+        return {}
+
+    ids = quote(json.dumps(summoner_ids, separators=(",", ":")))
+    response = rengar.lcu_request("GET", f"/lol-summoner/v2/summoners?ids={ids}", "")
+    if response.status_code == 200:
+        return {s.get("summonerId"): s for s in response.json()}
+
+    responses = rengar.lcu_gather([
+        ("GET", f"/lol-summoner/v1/summoners/{summoner_id}", "") for summoner_id in summoner_ids
+    ])
+    return {
+        summoner_id: resp.json()
+        for summoner_id, resp in zip(summoner_ids, responses)
+        if resp.status_code == 200
+    }
+
+
 def reveal():
     """Open Porofessor.gg for current lobby"""
     rengar = Rengar()
+    identity = (rengar.leaguePort, rengar.leagueToken)
     
     try:
-        champ_select = rengar.lcu_request("GET", "/lol-champ-select/v1/session", "")
+        if identity in _region_cache:
+            champ_select = rengar.lcu_request("GET", "/lol-champ-select/v1/session", "")
+        else:
+            # Fetch the region alongside the session on the first reveal
+            champ_select, get_region = rengar.lcu_gather([
+                ("GET", "/lol-champ-select/v1/session", ""),
+                ("GET", "/riotclient/region-locale", ""),
+            ])
+            if get_region.status_code == 200:
+                _cache_region(identity, get_region.json().get("webRegion", ""))
 
         if champ_select.status_code != 200 or "RPC_ERROR" in champ_select.text:
             print(colored("\nNot in champion select.\n", "red"))
@@ -24,6 +66,7 @@ def reveal():
 
         # Check players in team
         if "myTeam" in champ_select_data:
+            summoner_ids = []
             for player in champ_select_data["myTeam"]:
                 # Check if ranked (hidden names)
                 if player.get("nameVisibilityType") == "HIDDEN":
@@ -32,16 +75,17 @@ def reveal():
 
                 summoner_id = player.get("summonerId")
                 if summoner_id and summoner_id != "0":
-                    summoner = rengar.lcu_request(
-                        "GET", f"/lol-summoner/v1/summoners/{summoner_id}", ""
-                    )
-                    if summoner.status_code == 200:
-                        summoner_data = summoner.json()
-                        game_name = summoner_data.get('gameName', '')
-                        tag_line = summoner_data.get('tagLine', '')
-                        if game_name and tag_line:
-                            summ_name = f"{game_name}%23{tag_line}"
-                            summ_names.append(summ_name)
+                    summoner_ids.append(summoner_id)
+
+            if not is_ranked:
+                summoners = _get_summoners(rengar, summoner_ids)
+                for summoner_id in summoner_ids:
+                    summoner_data = summoners.get(summoner_id, {})
+                    game_name = summoner_data.get('gameName', '')
+                    tag_line = summoner_data.get('tagLine', '')
+                    if game_name and tag_line:
+                        summ_name = f"{game_name}%23{tag_line}"
+                        summ_names.append(summ_name)
 
             # If ranked, get from chat participants
             if is_ranked:
@@ -67,11 +111,13 @@ def reveal():
                     print(colored(f"Could not fetch ranked participants: {e}", "yellow"))
 
             # Get region
-            region = ""
-            get_region = rengar.lcu_request("GET", "/riotclient/region-locale", "")
-            if get_region.status_code == 200:
-                region_data = get_region.json()
-                region = region_data.get("webRegion", "")
+            region = _region_cache.get(identity, "")
+            if not region:
+                get_region = rengar.lcu_request("GET", "/riotclient/region-locale", "")
+                if get_region.status_code == 200:
+                    region_data = get_region.json()
+                    region = region_data.get("webRegion", "")
+                    _cache_region(identity, region)
 
             if region and summ_names:
                 summ_names_str = ",".join(summ_names)
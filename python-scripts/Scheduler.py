@@ -0,0 +1,85 @@
+"""
+Adaptive poll intervals for the background monitors, driven by the gameflow phase.
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Optional
+
+from Gameflow import get_gameflow_watcher
+
+
+@dataclass
+class PollIntervals:
+    """Sleep times in seconds for each situation."""
+    idle: float = 3.0           # home screen, in game, post game
+    queue: float = 1.0          # lobby or searching, champ select or a ready check can start soon
+    ready_check: float = 0.1    # ready check is up
+    champ_select: float = 0.5   # someone else's turn
+    my_turn: float = 0.1        # our action is in progress or about to start
+    done: float = 2.0           # champ select with nothing left for us to do
+    error: float = 1.0
+    turn_lead: float = 0.5      # wake this long before the phase timer runs out
+
+
+class PollScheduler:
+    """Picks how long each monitor sleeps from the gameflow phase and the champ select timer."""
+
+    def __init__(self, gameflow=None, intervals: Optional[PollIntervals] = None):
+        self.gameflow = gameflow or get_gameflow_watcher()
+        self.intervals = intervals or PollIntervals()
+
+    def phase(self) -> str:
+        """Current gameflow phase from the shared watcher."""
+        return self.gameflow.phase()
+
+    def ready_check_interval(self) -> float:
+        """How long the auto-accept monitor should sleep."""
+        phase = self.phase()
+        if phase == "ReadyCheck":
+            return self.intervals.ready_check
+        if phase == "Matchmaking":
+            return self.intervals.queue
+        return self.intervals.idle
+
+    def champ_select_interval(self, index=None) -> float:
+        """
+        How long the champ select monitor should sleep.
+
+        Args:
+            index: SessionIndex of the last session, None when there is no session
+        """
+        if index is None:
+            phase = self.phase()
+            if phase == "ChampSelect":
+                return self.intervals.my_turn
+            if phase in ("Matchmaking", "ReadyCheck"):
+                return self.intervals.champ_select
+            if phase == "Lobby":
+                return self.intervals.queue
+            return self.intervals.idle
+
+        if index.in_progress is not None:
+            return self.intervals.my_turn
+
+        if not index.my_pending:
+            return self.intervals.done
+
+        # Our turn can only start when the current timer runs out or someone locks early
+        time_left = index.session.get("timer", {}).get("adjustedTimeLeftInPhase", 0) / 1000
+        if 0 < time_left <= self.intervals.champ_select + self.intervals.turn_lead:
+            return max(self.intervals.my_turn, time_left - self.intervals.turn_lead)
+        return self.intervals.champ_select
+
+
+_scheduler: Optional[PollScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler() -> PollScheduler:
+    """Return the process-wide scheduler so monitors share one phase lookup."""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = PollScheduler()
+        return _scheduler
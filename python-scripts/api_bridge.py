@@ -1,56 +1,190 @@
 import sys
+import os
 import json
-from Rengar import Rengar, check_league_client
-from AutoAccept import autoaccept
-from InstalockAutoban import InstalockAutoban
-from disconnect_reconnect_chat import Chat
-from RemoveFriends import remove_all_friends
-from Badges import change_profile_badges
-from Icons import change_profile_icon
-from Backgrounds import change_profile_background
-from Riotidchanger import change_riotid
-from StatusChanger import change_status
-from Reveal import reveal
-from Dodge import dodge
-from RestartUX import restart
-
-# Initialize components
-rengar = Rengar()
-auto_accept = autoaccept()
-instalock_autoban = InstalockAutoban()
-chat = Chat()
+import threading
+import contextlib
+import contextvars
+import socketserver
+from dataclasses import dataclass
 
+# Progress sink for long-running methods, set per request while serving
+_progress = contextvars.ContextVar("progress", default=None)
 
+
+def report_progress(method, item):
+    """Stream a per-item progress update to the caller, no-op outside --serve"""
+    sink = _progress.get()
+    if sink is not None:
+        sink(method, item)
+
+
+# Feature modules are imported and built on first use, so a one-off call only
+# pays for the module it needs
+_components = {}
+_components_lock = threading.RLock()
+
+
+def _component(name, factory):
+    with _components_lock:
+        if name not in _components:
+            _components[name] = factory()
+        return _components[name]
+
+
+def get_rengar():
+    from Rengar import Rengar
+    return _component("rengar", Rengar)
+
+
+def get_auto_accept():
+    from AutoAccept import autoaccept
+    return _component("auto_accept", autoaccept)
+
+
+def get_instalock_autoban():
+    from InstalockAutoban import InstalockAutoban
+    return _component("instalock_autoban", InstalockAutoban)
+
+
+def get_chat():
+    from disconnect_reconnect_chat import Chat
+    return _component("chat", Chat)
+
+
+def get_profile_cache():
+    from Profile import ProfileCache
+    return _component("profile_cache", ProfileCache)
+
+
+class MethodNotFound(Exception):
+    pass
+
+
+class InvalidParams(Exception):
+    pass
+
+
+REQUIRED = object()
+
+
+def _to_bool(value, default=False):
+    """Parse a boolean argument coming from the CLI or a JSON-RPC request"""
+    if value is None:
+        return default
+    if isinstance(value, bool):
+        return value
+    return str(value).lower() == "true"
+
+
+@dataclass(frozen=True)
+class Param:
+    """One method argument: CLI strings and JSON values are converted to type"""
+    name: str
+    type: type = str
+    default: object = None
+
+    def convert(self, value):
+        if value is None or value == "":
+            if self.default is REQUIRED:
+                raise InvalidParams(f"{self.name} is required")
+            return self.default
+        try:
+            if self.type is bool:
+                return _to_bool(value, self.default)
+            return self.type(value)
+        except (TypeError, ValueError):
+            raise InvalidParams(f"{self.name} must be {self.type.__name__}, got {value!r}")
+
+
+@dataclass(frozen=True)
+class BridgeMethod:
+    name: str
+    handler: object
+    params: tuple
+
+    def bind(self, params):
+        """Keyword arguments for handler from a positional list or a dict of named params"""
+        if params is None:
+            params = []
+        if isinstance(params, dict):
+            unknown = set(params) - {param.name for param in self.params}
+            if unknown:
+                raise InvalidParams(f"unknown params for {self.name}: {', '.join(sorted(unknown))}")
+            values = [params.get(param.name) for param in self.params]
+        elif isinstance(params, (list, tuple)):
+            if len(params) > len(self.params):
+                raise InvalidParams(f"{self.name} takes at most {len(self.params)} params, got {len(params)}")
+            values = list(params) + [None] * (len(self.params) - len(params))
+        else:
+            raise InvalidParams("params must be a list or an object")
+
+        return {param.name: param.convert(value) for param, value in zip(self.params, values)}
+
+
+# name -> BridgeMethod, filled by @bridge_method; every transport (CLI, stdin, socket) dispatches here
+METHODS = {}
+
+
+def bridge_method(name, *params):
+    """Register a handler under name with its argument schema"""
+    def register(handler):
+        METHODS[name] = BridgeMethod(name, handler, params)
+        return handler
+    return register
+
+
+def invoke(method, params=None):
+    """Run a registered method, raising MethodNotFound or InvalidParams"""
+    entry = METHODS.get(method)
+    if entry is None:
+        raise MethodNotFound(f"Unknown method: {method}")
+    return entry.handler(**entry.bind(params))
+
+
+def call_method(method, args):
+    """Run a bridge method with positional or named arguments and return its result"""
+    try:
+        return invoke(method, args)
+    except (MethodNotFound, InvalidParams) as e:
+        return {"success": False, "error": str(e)}
+
+
+@bridge_method("check_client")
 def check_client():
     """Check if League client is running"""
     try:
-        port, token = check_league_client()
+        # One lookup, never waits for the client to start
+        from Rengar import credentials
+        port, token = credentials.league()
+        if port is None or token is None:
+            return {"success": True, "connected": False}
         return {"success": True, "connected": True, "port": port}
     except:
         return {"success": True, "connected": False}
 
 
+@bridge_method("get_summoner_info")
 def get_summoner_info():
     """Get current summoner information"""
     try:
-        summoner_resp = rengar.lcu_request("GET", "/lol-summoner/v1/current-summoner", "")
-        if summoner_resp.status_code == 200:
-            summoner = summoner_resp.json()
+        # Served from memory, only stale entries hit the client
+        profile = get_profile_cache().get("summoner", "region", "ranked")
+
+        summoner = profile["summoner"]
+        if summoner is not None:
             ign = f"{summoner.get('gameName', 'Unknown')}#{summoner.get('tagLine', 'Unknown')}"
             level = summoner.get("summonerLevel", "Unknown")
         else:
             return {"success": False, "error": "Failed to get summoner data"}
 
-        region_resp = rengar.lcu_request("GET", "/riotclient/region-locale", "")
-        if region_resp.status_code == 200:
-            region_data = region_resp.json()
+        region_data = profile["region"]
+        if region_data is not None:
             region = region_data.get("webRegion", "Unknown")
         else:
             region = "Unknown"
 
-        ranked_resp = rengar.lcu_request("GET", "/lol-ranked/v1/current-ranked-stats", "")
-        if ranked_resp.status_code == 200:
-            ranked_data = ranked_resp.json()
+        ranked_data = profile["ranked"]
+        if ranked_data is not None:
             solo_queue = next(
                 (q for q in ranked_data.get("queues", []) if q.get("queueType") == "RANKED_SOLO_5x5"),
                 None
@@ -76,18 +210,21 @@ def get_summoner_info():
         return {"success": False, "error": str(e)}
 
 
+@bridge_method("toggle_auto_accept", Param("enabled", bool, False))
 def toggle_auto_accept_func(enabled):
     """Toggle auto accept"""
     try:
-        auto_accept.auto_accept_enabled = enabled
+        get_auto_accept().auto_accept_enabled = enabled
         return {"success": True, "enabled": enabled}
     except Exception as e:
         return {"success": False, "error": str(e)}
 
 
+@bridge_method("set_instalock", Param("champion_name", str, ""), Param("enabled", bool, False))
 def set_instalock_func(champion_name, enabled):
     """Set instalock champion"""
     try:
+        instalock_autoban = get_instalock_autoban()
         if enabled:
             success = instalock_autoban.set_instalock_champion(champion_name)
             if success:
@@ -102,9 +239,12 @@ def set_instalock_func(champion_name, enabled):
         return {"success": False, "error": str(e)}
 
 
+@bridge_method("set_autoban", Param("champion_name", str, ""), Param("enabled", bool, False),
+               Param("protect_ban", bool, True))
 def set_autoban_func(champion_name, enabled, protect_ban=True):
     """Set auto ban champion"""
     try:
+        instalock_autoban = get_instalock_autoban()
         if enabled:
             success = instalock_autoban.set_auto_ban_champion(champion_name)
             if success:
@@ -120,28 +260,61 @@ def set_autoban_func(champion_name, enabled, protect_ban=True):
         return {"success": False, "error": str(e)}
 
 
+@bridge_method("get_latency_stats")
+def get_latency_stats_func():
+    """Get champ select and ready check latency percentiles"""
+    try:
+        return {
+            "success": True,
+            "champ_select": get_instalock_autoban().get_latency_stats(),
+            "ready_check": get_auto_accept().get_latency_stats(),
+        }
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+
+@bridge_method("get_status")
+def get_status_func():
+    """Get the state of the background features"""
+    try:
+        return {
+            "success": True,
+            "auto_accept": {"enabled": get_auto_accept().auto_accept_enabled},
+            "instalock_autoban": get_instalock_autoban().get_status(),
+        }
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+
+@bridge_method("toggle_chat", Param("disconnect", bool, False))
 def toggle_chat_func(disconnect):
     """Toggle chat connection"""
     try:
+        chat = get_chat()
         if disconnect:
             success = chat.disconnect()
         else:
             success = chat.reconnect()
         
-        return {"success": success, "disconnected": disconnect}
+        return {"success": success, "disconnected": chat.chat_state}
     except Exception as e:
         return {"success": False, "error": str(e)}
 
 
+@bridge_method("change_icon", Param("icon_id", int, REQUIRED))
 def change_icon_func(icon_id):
     """Change profile icon"""
     try:
+        from Icons import change_profile_icon
         success = change_profile_icon(icon_id)
+        if success:
+            get_profile_cache().invalidate("summoner")
         return {"success": success}
     except Exception as e:
         return {"success": False, "error": str(e)}
 
 
+@bridge_method("change_background", Param("skin_id", int, REQUIRED))
 def change_background_func(skin_id):
     """Change profile background - FIXED VERSION WITH DEBUG"""
     try:
@@ -159,7 +332,7 @@ def change_background_func(skin_id):
             print(f"[Background] Request body: {body}")
             print(f"[Background] Calling POST /lol-summoner/v1/current-summoner/summoner-profile")
             
-            response = rengar.lcu_request('POST', "/lol-summoner/v1/current-summoner/summoner-profile", body)
+            response = get_rengar().lcu_request('POST', "/lol-summoner/v1/current-summoner/summoner-profile", body)
             
             print(f"[Background] Response status: {response.status_code}")
             print(f"[Background] Response headers: {dict(response.headers)}")
@@ -202,6 +375,20 @@ def change_background_func(skin_id):
         return {"success": False, "error": str(e)}
 
 
+@bridge_method("search_skins", Param("query", str, ""), Param("limit", int, 20))
+def search_skins_func(query, limit=20):
+    """Search skins for the background picker"""
+    try:
+        from Backgrounds import fetch_all_champion_skins, search_skins_by_name
+        champions = fetch_all_champion_skins()
+        if not champions:
+            return {"success": False, "error": "Failed to load skins"}
+        return {"success": True, "skins": search_skins_by_name(champions, query, int(limit))}
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+
+@bridge_method("change_riot_id", Param("name", str, ""), Param("tag", str, ""))
 def change_riot_id_func(name, tag):
     """Change Riot ID"""
     try:
@@ -214,24 +401,31 @@ def change_riot_id_func(name, tag):
         if len(tag) > 5:
             return {"success": False, "error": "Tag too long (max 5)"}
         
+        from Riotidchanger import change_riotid
         success = change_riotid(name, tag)
+        if success:
+            get_profile_cache().invalidate("summoner")
         return {"success": success}
     except Exception as e:
         return {"success": False, "error": str(e)}
 
 
+@bridge_method("change_status", Param("status_message", str, ""))
 def change_status_func(status_message):
     """Change status message"""
     try:
+        from StatusChanger import change_status
         success = change_status(status_message)
         return {"success": success}
     except Exception as e:
         return {"success": False, "error": str(e)}
 
 
+@bridge_method("reveal_lobby")
 def reveal_lobby_func():
     """Open Porofessor.gg for current lobby"""
     try:
+        from Reveal import reveal
         url = reveal()
         if url:
             return {"success": True, "url": url}
@@ -241,58 +435,243 @@ def reveal_lobby_func():
         return {"success": False, "error": str(e)}
 
 
+@bridge_method("dodge")
 def dodge_func():
     """Dodge current game"""
     try:
+        from Dodge import dodge
         success = dodge()
         return {"success": success}
     except Exception as e:
         return {"success": False, "error": str(e)}
 
 
-def remove_friends_func():
-    """Remove all friends"""
+@bridge_method("remove_friends", Param("dry_run", bool, False), Param("group"), Param("name_pattern"),
+               Param("offline_days", float))
+def remove_friends_func(dry_run=False, group=None, name_pattern=None, offline_days=None):
+    """Remove all friends, or only those matching the filters"""
     try:
-        response = rengar.lcu_request("GET", "/lol-chat/v1/friends", "")
-        
-        if response.status_code == 200:
-            friends = response.json()
-            removed_count = 0
-            
-            for friend in friends:
-                friend_id = friend.get("pid")
-                try:
-                    delete_response = rengar.lcu_request("DELETE", f"/lol-chat/v1/friends/{friend_id}", "")
-                    if delete_response.status_code in [200, 204]:
-                        removed_count += 1
-                except:
-                    pass
-            
-            return {"success": True, "removed": removed_count}
-        
-        return {"success": False, "error": "Failed to get friends list"}
+        from RemoveFriends import get_friends, friend_filter, iter_remove_friends
+        friends = get_friends()
+        if friends is None:
+            return {"success": False, "error": "Failed to get friends list"}
+
+        predicate = None
+        if group or name_pattern or offline_days is not None:
+            predicate = friend_filter(group, name_pattern, offline_days)
+
+        removed_count = 0
+        failed = []
+        for result in iter_remove_friends(friends, predicate, dry_run=dry_run):
+            report_progress("remove_friends", result)
+            if result["success"]:
+                removed_count += 1
+            else:
+                failed.append(result)
+
+        if dry_run:
+            # Nothing was deleted, report the matches apart from real removals
+            return {"success": True, "removed": 0, "wouldRemove": removed_count, "failed": 0,
+                    "failures": [], "dryRun": True}
+        return {"success": True, "removed": removed_count, "failed": len(failed), "failures": failed}
     except Exception as e:
         return {"success": False, "error": str(e)}
 
 
+@bridge_method("restart_client")
 def restart_client_func():
     """Restart League client UX"""
     try:
+        from RestartUX import restart
         success = restart()
         return {"success": success}
     except Exception as e:
         return {"success": False, "error": str(e)}
 
 
+@bridge_method("change_badges")
 def change_badges_func():
     """Change profile badges"""
     try:
+        from Badges import change_profile_badges
         change_profile_badges()
         return {"success": True}
     except Exception as e:
         return {"success": False, "error": str(e)}
 
 
+# JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+
+def _rpc_error(request_id, code, message):
+    return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
+
+
+def handle_rpc_request(request, notify=None):
+    """Handle one decoded JSON-RPC request object and return the response dict
+
+    Notifications (no "id") are run but get no response, None is returned.
+    """
+    if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+        return _rpc_error(None, INVALID_REQUEST, "Invalid request")
+
+    if "id" not in request:
+        handle_rpc_request(dict(request, id=None), notify)
+        return None
+
+    request_id = request.get("id")
+
+    def sink(method, item):
+        if notify is not None:
+            notify({"jsonrpc": "2.0", "method": "progress",
+                    "params": {"id": request_id, "method": method, "item": item}})
+
+    token = _progress.set(sink)
+    try:
+        result = invoke(request["method"], request.get("params"))
+    except MethodNotFound as e:
+        return _rpc_error(request_id, METHOD_NOT_FOUND, str(e))
+    except InvalidParams as e:
+        return _rpc_error(request_id, INVALID_PARAMS, str(e))
+    except Exception as e:
+        return _rpc_error(request_id, INTERNAL_ERROR, str(e))
+    finally:
+        _progress.reset(token)
+
+    return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+
+def handle_rpc_line(line, notify=None):
+    """Handle one line-delimited JSON-RPC request, or a batch array of them
+
+    notify, if given, receives progress notifications sent while the methods run.
+    A batch is answered with an array of responses in request order, leaving out
+    notifications. Returns None when there is nothing to answer.
+    """
+    try:
+        request = json.loads(line)
+    except ValueError as e:
+        return _rpc_error(None, PARSE_ERROR, f"Parse error: {e}")
+
+    if isinstance(request, list):
+        if not request:
+            return _rpc_error(None, INVALID_REQUEST, "Empty batch")
+        responses = [handle_rpc_request(item, notify) for item in request]
+        return [response for response in responses if response is not None] or None
+
+    return handle_rpc_request(request, notify)
+
+
+def call_batch(calls):
+    """Run several calls in order, each a [method, *args] list or a {"method", "params"} object"""
+    results = []
+    for call in calls:
+        if isinstance(call, dict):
+            method, params = call.get("method"), call.get("params")
+        elif isinstance(call, list) and call:
+            method, params = call[0], call[1:]
+        else:
+            results.append({"success": False, "error": f"Invalid call: {call!r}"})
+            continue
+        try:
+            results.append(call_method(method, params))
+        except Exception as e:
+            results.append({"success": False, "error": str(e)})
+    return results
+
+
+# Requests run concurrently, so one slow method does not hold up the ones behind it
+RPC_WORKERS = 8
+# How long a closed stream waits for requests still running before giving up on them
+RPC_DRAIN_TIMEOUT = 5.0
+
+
+def get_rpc_pool():
+    from concurrent.futures import ThreadPoolExecutor
+    return _component("rpc_pool", lambda: ThreadPoolExecutor(max_workers=RPC_WORKERS, thread_name_prefix="RPC"))
+
+
+def _serve_stream(reader, write):
+    """Read requests line by line and answer each from the worker pool, in completion order"""
+    lock = threading.Lock()
+
+    def send(message):
+        data = json.dumps(message) + "\n"
+        with lock:
+            write(data)
+
+    def run(line):
+        try:
+            response = handle_rpc_line(line, send)
+        except Exception as e:
+            response = _rpc_error(None, INTERNAL_ERROR, str(e))
+        if response is not None:
+            send(response)
+
+    from concurrent.futures import wait
+
+    pool = get_rpc_pool()
+    pending = set()
+    for line in reader:
+        line = line.strip()
+        if line:
+            future = pool.submit(run, line)
+            pending.add(future)
+            future.add_done_callback(pending.discard)
+
+    # Answer what was already read before the stream is closed, a method stuck waiting
+    # for the client does not keep it open
+    wait(list(pending), timeout=RPC_DRAIN_TIMEOUT)
+
+
+def _start_monitors():
+    """Start the background monitors, their toggles persist while serving"""
+    threading.Thread(target=get_auto_accept().monitor_queue, daemon=True, name="AutoAcceptMonitor").start()
+    get_instalock_autoban().start_monitor()
+
+    from Gameflow import get_gameflow_watcher
+    get_profile_cache().watch_gameflow(get_gameflow_watcher())
+
+    from LCUEvents import get_event_client
+    get_chat().watch_events(get_event_client())
+
+
+def serve_stdin(out):
+    """Serve JSON-RPC requests from stdin, one JSON object per line, answering on out"""
+    def write(data):
+        out.write(data)
+        out.flush()
+
+    _serve_stream(sys.stdin, write)
+
+
+def serve_socket(path):
+    """Serve JSON-RPC requests over a local Unix socket"""
+    if not hasattr(socketserver, "ThreadingUnixStreamServer"):
+        raise RuntimeError("Unix sockets are not supported on this platform")
+
+    class _Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            def write(data):
+                self.wfile.write(data.encode("utf-8"))
+                self.wfile.flush()
+
+            reader = (raw.decode("utf-8") for raw in self.rfile)
+            _serve_stream(reader, write)
+
+    if os.path.exists(path):
+        os.remove(path)
+
+    with socketserver.ThreadingUnixStreamServer(path, _Handler) as server:
+        server.daemon_threads = True
+        server.serve_forever()
+
+
 # Main execution
 if __name__ == "__main__":
     if len(sys.argv) < 2:
@@ -301,72 +680,31 @@ if __name__ == "__main__":
     
     method = sys.argv[1]
     args = sys.argv[2:] if len(sys.argv) > 2 else []
-    
-    result = None
+
+    if method == "--serve":
+        # Feature modules and monitor threads print to stdout, so for the whole session it
+        # goes to stderr and responses are written only to the original handle
+        out = sys.stdout
+        sys.stdout = sys.stderr
+        _start_monitors()
+        if len(args) > 1 and args[0] == "--socket":
+            serve_socket(args[1])
+        else:
+            serve_stdin(out)
+        # Skip joining the worker pool, a request stuck waiting for the client would hang the exit
+        out.flush()
+        os._exit(0)
     
     try:
-        if method == "check_client":
-            result = check_client()
-            
-        elif method == "get_summoner_info":
-            result = get_summoner_info()
-            
-        elif method == "toggle_auto_accept":
-            enabled = args[0].lower() == "true" if args else False
-            result = toggle_auto_accept_func(enabled)
-            
-        elif method == "set_instalock":
-            champion = args[0] if args else ""
-            enabled = args[1].lower() == "true" if len(args) > 1 else False
-            result = set_instalock_func(champion, enabled)
-            
-        elif method == "set_autoban":
-            champion = args[0] if args else ""
-            enabled = args[1].lower() == "true" if len(args) > 1 else False
-            protect = args[2].lower() == "true" if len(args) > 2 else True
-            result = set_autoban_func(champion, enabled, protect)
-            
-        elif method == "toggle_chat":
-            disconnect = args[0].lower() == "true" if args else False
-            result = toggle_chat_func(disconnect)
-            
-        elif method == "change_icon":
-            icon_id = args[0] if args else None
-            result = change_icon_func(icon_id)
-            
-        elif method == "change_background":
-            skin_id = args[0] if args else None
-            result = change_background_func(skin_id)
-            
-        elif method == "change_riot_id":
-            name = args[0] if args else ""
-            tag = args[1] if len(args) > 1 else ""
-            result = change_riot_id_func(name, tag)
-            
-        elif method == "change_status":
-            status = args[0] if args else ""
-            result = change_status_func(status)
-            
-        elif method == "reveal_lobby":
-            result = reveal_lobby_func()
-            
-        elif method == "dodge":
-            result = dodge_func()
-            
-        elif method == "change_badges":
-            result = change_badges_func()
-            
-        elif method == "remove_friends":
-            result = remove_friends_func()
-            
-        elif method == "restart_client":
-            result = restart_client_func()
-            
+        if method == "--batch":
+            # --batch '[["check_client"], ["get_summoner_info"]]', or --batch - to read it from stdin
+            source = sys.stdin.read() if not args or args[0] == "-" else args[0]
+            with contextlib.redirect_stdout(sys.stderr):
+                result = call_batch(json.loads(source))
         else:
-            result = {"success": False, "error": f"Unknown method: {method}"}
-        
+            result = call_method(method, args)
         print(json.dumps(result))
         
     except Exception as e:
         print(json.dumps({"success": False, "error": str(e)}))
-        sys.exit(1)
\ No newline at end of file
+        sys.exit(1)
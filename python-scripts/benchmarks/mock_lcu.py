@@ -0,0 +1,546 @@
+"""
+Mock LCU server for benchmarks - stdlib only.
+
+Serves the endpoints the toolkit uses (champ select session, ready check, gameflow phase,
+friends, summoner) with optional artificial latency, plus a minimal WAMP WebSocket so the
+event-driven paths can be measured too. Serves https like the real client, with a
+self-signed certificate generated by the openssl CLI unless one is given (--no-tls for plain
+http); the lockfile tells Rengar which protocol to use.
+
+    python benchmarks/mock_lcu.py --latency-ms 5
+"""
+
+import argparse
+import base64
+import copy
+import hashlib
+import json
+import os
+import re
+import socket
+import ssl
+import struct
+import subprocess
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional
+
+PASSWORD = "mock-password"
+WEBSOCKET_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+# WAMP 1.0 message types, same as LCUEvents
+WAMP_SUBSCRIBE = 5
+WAMP_UNSUBSCRIBE = 6
+WAMP_EVENT = 8
+
+DEFAULT_CHAMPIONS = ["Annie", "Yasuo", "Miss Fortune", "Zed", "Ahri", "Lux", "Lee Sin", "Kai'Sa"]
+
+ACTION_PATH = re.compile(r"^/lol-champ-select/v1/session/actions/(\d+)$")
+FRIEND_PATH = re.compile(r"^/lol-chat/v1/friends/([^/]+)$")
+
+
+def event_name(uri: str) -> str:
+    """WAMP event name the LCU uses for an endpoint."""
+    return "OnJsonApiEvent" + uri.replace("/", "_")
+
+
+def action(action_id: int, cell_id: int, action_type: str, champion_id: int = 0,
+           completed: bool = False, in_progress: bool = False) -> dict:
+    """One champ select action as the client reports it."""
+    return {
+        "id": action_id,
+        "actorCellId": cell_id,
+        "type": action_type,
+        "championId": champion_id,
+        "completed": completed,
+        "isInProgress": in_progress,
+    }
+
+
+def champ_select_session(actions: List[List[dict]], game_id: int = 1, cell_id: int = 0,
+                         phase: str = "BAN_PICK", time_left_ms: int = 30000) -> dict:
+    """A champ select session with the given action groups and a running timer."""
+    total = 30000
+    return {
+        "gameId": game_id,
+        "localPlayerCellId": cell_id,
+        "actions": actions,
+        "bans": {"myTeamBans": [], "theirTeamBans": []},
+        "myTeam": [{"cellId": i} for i in range(5)],
+        "theirTeam": [{"cellId": i} for i in range(5, 10)],
+        "timer": {
+            "phase": phase,
+            "adjustedTimeLeftInPhase": time_left_ms,
+            "totalTimeInPhase": total,
+            "internalNowInEpochMs": int(time.time() * 1000),
+        },
+    }
+
+
+class _WebSocket:
+    """Server side of one WebSocket connection, just enough for WAMP text frames."""
+
+    def __init__(self, sock, rfile):
+        self.sock = sock
+        self.rfile = rfile
+        self.subscriptions = set()
+        self._send_lock = threading.Lock()
+
+    def recv(self):
+        header = self.rfile.read(2)
+        if len(header) < 2:
+            return 8, b""
+        opcode = header[0] & 0x0F
+        length = header[1] & 0x7F
+        if length == 126:
+            length = struct.unpack(">H", self.rfile.read(2))[0]
+        elif length == 127:
+            length = struct.unpack(">Q", self.rfile.read(8))[0]
+        mask = self.rfile.read(4) if header[1] & 0x80 else b"\0\0\0\0"
+        payload = bytearray(self.rfile.read(length))
+        for i in range(len(payload)):
+            payload[i] ^= mask[i % 4]
+        return opcode, bytes(payload)
+
+    def send(self, opcode: int, payload: bytes) -> None:
+        header = bytearray([0x80 | opcode])
+        if len(payload) < 126:
+            header.append(len(payload))
+        elif len(payload) < 1 << 16:
+            header.append(126)
+            header += struct.pack(">H", len(payload))
+        else:
+            header.append(127)
+            header += struct.pack(">Q", len(payload))
+        with self._send_lock:
+            self.sock.sendall(bytes(header) + payload)
+
+    def send_text(self, text: str) -> None:
+        self.send(1, text.encode("utf-8"))
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "MockLCU"
+    disable_nagle_algorithm = True
+
+    @property
+    def mock(self) -> "MockLCU":
+        return self.server.mock
+
+    def setup(self):
+        context = self.server.ssl_context
+        if context is not None:
+            # Handshake on this connection's thread with Nagle already off, not serialized in accept()
+            self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, True)
+            self.request = context.wrap_socket(self.request, server_side=True)
+        super().setup()
+
+    def log_message(self, *args):
+        pass
+
+    def _authorized(self) -> bool:
+        expected = "Basic " + base64.b64encode(f"riot:{PASSWORD}".encode()).decode()
+        return self.headers.get("Authorization") == expected
+
+    def _reply(self, status: int, body=None) -> None:
+        data = b"" if body is None else json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        return json.loads(raw) if raw else None
+
+    def _handle(self, method: str) -> None:
+        if not self._authorized():
+            return self._reply(401, {"message": "unauthorized"})
+
+        if self.mock.latency:
+            time.sleep(self.mock.latency)
+
+        self.mock.count_request(method, self.path)
+        status, body = self.mock.route(method, self.path, self._body())
+        self._reply(status, body)
+
+    def do_GET(self):
+        if self.headers.get("Upgrade", "").lower() == "websocket":
+            return self._upgrade()
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def do_PUT(self):
+        self._handle("PUT")
+
+    def do_PATCH(self):
+        self._handle("PATCH")
+
+    def do_DELETE(self):
+        self._handle("DELETE")
+
+    def _upgrade(self) -> None:
+        if not self.mock.websocket or not self._authorized():
+            return self._reply(400 if not self.mock.websocket else 401)
+
+        key = self.headers.get("Sec-WebSocket-Key", "")
+        accept = base64.b64encode(hashlib.sha1((key + WEBSOCKET_GUID).encode()).digest()).decode()
+        self.send_response(101)
+        self.send_header("Upgrade", "websocket")
+        self.send_header("Connection", "Upgrade")
+        self.send_header("Sec-WebSocket-Accept", accept)
+        self.end_headers()
+        self.wfile.flush()
+        self.close_connection = True
+
+        ws = _WebSocket(self.connection, self.rfile)
+        self.mock.add_socket(ws)
+        try:
+            while True:
+                opcode, payload = ws.recv()
+                if opcode == 8:
+                    break
+                if opcode == 9:
+                    ws.send(10, payload)
+                    continue
+                if opcode != 1:
+                    continue
+                try:
+                    message = json.loads(payload)
+                except ValueError:
+                    continue
+                if message and message[0] == WAMP_SUBSCRIBE:
+                    ws.subscriptions.add(message[1])
+                elif message and message[0] == WAMP_UNSUBSCRIBE:
+                    ws.subscriptions.discard(message[1])
+        except OSError:
+            pass
+        finally:
+            self.mock.remove_socket(ws)
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    ssl_context: Optional[ssl.SSLContext] = None
+
+    def handle_error(self, request, client_address):
+        # Clients exiting mid-request (benchmark subprocesses) are expected
+        pass
+
+
+class MockLCU:
+    """A scriptable stand-in for the League client API."""
+
+    def __init__(self, latency: float = 0.0, websocket: bool = True,
+                 certfile: Optional[str] = None, keyfile: Optional[str] = None,
+                 champions: Optional[List[str]] = None, tls: bool = True):
+        self.latency = latency
+        self.websocket = websocket
+        self.tls = tls or bool(certfile)
+        self.certfile = certfile
+        self.keyfile = keyfile
+        self.champions = [
+            {"id": i, "name": name, "alias": name.replace(" ", "").replace("'", "")}
+            for i, name in enumerate(champions or DEFAULT_CHAMPIONS, 1)
+        ]
+
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._sockets: List[_WebSocket] = []
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._dir = None
+
+        self.phase = "None"
+        self.session: Optional[dict] = None
+        self.ready_check: Optional[dict] = None
+        self.friends: Dict[str, dict] = {}
+        self.summoner = {
+            "gameName": "Mock", "tagLine": "LTK", "summonerLevel": 30,
+            "summonerId": 1, "puuid": "mock-puuid", "profileIconId": 1,
+        }
+        self.chat_state = "connected"
+        self.ranked = {"queues": [{"queueType": "RANKED_SOLO_5x5", "tier": "GOLD", "division": "II", "leaguePoints": 42}]}
+        self.requests: Dict[str, int] = {}
+        self.patches: List[tuple] = []
+        self.accepts: List[float] = []
+
+    # Lifecycle
+
+    @property
+    def protocol(self) -> str:
+        return "https" if self.tls else "http"
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    def start(self, port: int = 0) -> "MockLCU":
+        """Start serving and write a lockfile pointing at this server."""
+        self._dir = tempfile.mkdtemp(prefix="mock-lcu-")
+        if self.tls and not self.certfile:
+            self.certfile, self.keyfile = self._generate_certificate()
+
+        self._server = _Server(("127.0.0.1", port), _Handler)
+        self._server.mock = self
+        if self.tls:
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            context.load_cert_chain(self.certfile, self.keyfile)
+            self._server.ssl_context = context
+        threading.Thread(target=self._server.serve_forever, daemon=True, name="MockLCU").start()
+
+        with open(os.path.join(self._dir, "lockfile"), "w") as f:
+            f.write(f"LeagueClient:{os.getpid()}:{self.port}:{PASSWORD}:{self.protocol}")
+        return self
+
+    def _generate_certificate(self):
+        """Self-signed certificate for 127.0.0.1 in the mock's temp dir, like the client's own."""
+        certfile = os.path.join(self._dir, "mock-lcu.pem")
+        keyfile = os.path.join(self._dir, "mock-lcu-key.pem")
+        try:
+            subprocess.run(
+                ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+                 "-subj", "/CN=127.0.0.1", "-keyout", keyfile, "-out", certfile],
+                check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            )
+        except (OSError, subprocess.CalledProcessError) as e:
+            raise RuntimeError(f"could not generate a certificate with openssl ({e}), "
+                               "pass one with --cert/--key or use --no-tls") from e
+        return certfile, keyfile
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+
+    def environ(self) -> Dict[str, str]:
+        """Environment that points Rengar and the cache at this mock."""
+        return {
+            "LTK_LEAGUE_DIR": self._dir,
+            "LTK_CACHE_DIR": os.path.join(self._dir, "cache"),
+        }
+
+    # Scripting
+
+    def set_phase(self, phase: str) -> None:
+        with self._lock:
+            changed = phase != self.phase
+            self.phase = phase
+            self._changed.notify_all()
+        if changed:
+            self.publish("/lol-gameflow/v1/gameflow-phase", "Update", phase)
+
+    def set_session(self, session: Optional[dict]) -> float:
+        """Replace the champ select session. Returns the perf_counter time it took effect."""
+        with self._lock:
+            event_type = "Delete" if session is None else ("Create" if self.session is None else "Update")
+            self.session = session
+            now = time.perf_counter()
+            self._changed.notify_all()
+        if session is not None:
+            self.set_phase("ChampSelect")
+        self.publish("/lol-champ-select/v1/session", event_type, session)
+        return now
+
+    def play_timeline(self, steps: List[tuple]) -> threading.Thread:
+        """Apply (delay_seconds, session) steps in order on a background thread."""
+        def run():
+            for delay, session in steps:
+                time.sleep(delay)
+                self.set_session(session)
+        thread = threading.Thread(target=run, daemon=True, name="MockTimeline")
+        thread.start()
+        return thread
+
+    def start_ready_check(self) -> float:
+        """Pop a ready check. Returns the perf_counter time it appeared."""
+        with self._lock:
+            self.ready_check = {"state": "InProgress", "playerResponse": "None", "timer": 0.0}
+            now = time.perf_counter()
+        self.set_phase("ReadyCheck")
+        self.publish("/lol-matchmaking/v1/ready-check", "Update", self.ready_check)
+        return now
+
+    def set_chat_state(self, state: str) -> None:
+        with self._lock:
+            changed = state != self.chat_state
+            self.chat_state = state
+        if changed:
+            self.publish("/chat/v1/session", "Update", {"state": state})
+
+    def set_friends(self, count: int) -> None:
+        with self._lock:
+            self.friends = {
+                f"puuid-{i}@br1.pvp.net": {
+                    "id": f"puuid-{i}@br1.pvp.net", "pid": f"puuid-{i}@br1.pvp.net",
+                    "puuid": f"puuid-{i}", "summonerId": i,
+                    "gameName": f"Friend{i}", "gameTag": "BR1", "name": f"Friend{i}",
+                    "groupName": "**Default", "availability": "offline",
+                    "lastSeenOnlineTimestamp": None,
+                }
+                for i in range(count)
+            }
+
+    def wait_until(self, predicate: Callable[["MockLCU"], bool], timeout: float) -> bool:
+        """Block until predicate(self) is true after a state change."""
+        with self._changed:
+            return self._changed.wait_for(lambda: predicate(self), timeout)
+
+    # Events
+
+    def add_socket(self, ws: _WebSocket) -> None:
+        with self._lock:
+            self._sockets.append(ws)
+
+    def remove_socket(self, ws: _WebSocket) -> None:
+        with self._lock:
+            if ws in self._sockets:
+                self._sockets.remove(ws)
+
+    def publish(self, uri: str, event_type: str, data) -> None:
+        event = event_name(uri)
+        frame = json.dumps([WAMP_EVENT, event, {"data": data, "eventType": event_type, "uri": uri}])
+        with self._lock:
+            sockets = [ws for ws in self._sockets if event in ws.subscriptions]
+        for ws in sockets:
+            try:
+                ws.send_text(frame)
+            except OSError:
+                self.remove_socket(ws)
+
+    # Routing
+
+    def count_request(self, method: str, path: str) -> None:
+        key = f"{method} {path.split('?')[0]}"
+        with self._lock:
+            self.requests[key] = self.requests.get(key, 0) + 1
+
+    def route(self, method: str, path: str, body):
+        path = path.split("?")[0]
+
+        if method == "GET":
+            if path == "/lol-champ-select/v1/session":
+                session = self.session
+                if session is None:
+                    return 404, {"errorCode": "RPC_ERROR", "httpStatus": 404, "message": "No active delegate"}
+                return 200, session
+            if path == "/lol-gameflow/v1/gameflow-phase":
+                return 200, self.phase
+            if path == "/lol-matchmaking/v1/ready-check":
+                if self.ready_check is None:
+                    return 404, {"errorCode": "RPC_ERROR", "httpStatus": 404, "message": "Not attached to a matchmaking queue."}
+                return 200, self.ready_check
+            if path == "/lol-lobby/v2/lobby/matchmaking/search-state":
+                if self.ready_check is not None and self.ready_check["state"] == "InProgress":
+                    return 200, {"searchState": "Found"}
+                return 200, {"searchState": "Searching" if self.phase == "Matchmaking" else "Invalid"}
+            if path == "/lol-chat/v1/friends":
+                with self._lock:
+                    return 200, list(self.friends.values())
+            if path == "/lol-summoner/v1/current-summoner":
+                return 200, self.summoner
+            if path == "/riotclient/region-locale":
+                return 200, {"region": "BR", "webRegion": "br", "locale": "pt_BR"}
+            if path == "/lol-ranked/v1/current-ranked-stats":
+                return 200, self.ranked
+            if path == "/lol-patch/v1/game-version":
+                return 200, "14.20.600.1234"
+            if path == "/lol-champ-select/v1/all-grid-champions":
+                return 200, self.champions
+            if path == "/chat/v1/session":
+                return 200, {"state": self.chat_state}
+
+        elif method == "POST":
+            if path == "/lol-matchmaking/v1/ready-check/accept":
+                return self._accept()
+            if path == "/chat/v1/suspend":
+                self.set_chat_state("disconnected")
+                return 204, None
+            if path == "/chat/v1/resume":
+                self.set_chat_state("connected")
+                return 204, None
+
+        elif method == "PUT":
+            if path == "/lol-summoner/v1/current-summoner/icon":
+                with self._lock:
+                    self.summoner = dict(self.summoner, profileIconId=(body or {}).get("profileIconId"))
+                return 201, self.summoner
+
+        elif method == "PATCH":
+            match = ACTION_PATH.match(path)
+            if match:
+                return self._patch_action(int(match.group(1)), body or {})
+
+        elif method == "DELETE":
+            match = FRIEND_PATH.match(path)
+            if match:
+                with self._lock:
+                    removed = self.friends.pop(match.group(1), None)
+                    self._changed.notify_all()
+                return (204, None) if removed else (404, {"message": "friend not found"})
+
+        return 404, {"errorCode": "RPC_ERROR", "httpStatus": 404, "message": f"No handler for {method} {path}"}
+
+    def _accept(self):
+        with self._lock:
+            if self.ready_check is None:
+                return 500, {"message": "Not in a ready check"}
+            self.ready_check = dict(self.ready_check, playerResponse="Accepted")
+            self.accepts.append(time.perf_counter())
+            ready_check = self.ready_check
+            self._changed.notify_all()
+        self.publish("/lol-matchmaking/v1/ready-check", "Update", ready_check)
+        return 204, None
+
+    def _patch_action(self, action_id: int, changes: dict):
+        with self._lock:
+            if self.session is None:
+                return 404, {"message": "No active delegate"}
+            session = copy.deepcopy(self.session)
+            for group in session.get("actions", []):
+                for item in group:
+                    if item.get("id") == action_id:
+                        item.update({k: v for k, v in changes.items() if k in ("championId", "completed")})
+                        if item.get("completed"):
+                            item["isInProgress"] = False
+                        break
+            self.session = session
+            self.patches.append((time.perf_counter(), action_id, dict(changes)))
+            self._changed.notify_all()
+        self.publish("/lol-champ-select/v1/session", "Update", session)
+        return 204, None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a mock LCU server")
+    parser.add_argument("--port", type=int, default=0)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--no-websocket", action="store_true")
+    parser.add_argument("--cert")
+    parser.add_argument("--key")
+    parser.add_argument("--no-tls", action="store_true", help="serve plain http")
+    parser.add_argument("--friends", type=int, default=50)
+    args = parser.parse_args()
+
+    mock = MockLCU(args.latency_ms / 1000, not args.no_websocket, args.cert, args.key,
+                   tls=not args.no_tls).start(args.port)
+    mock.set_friends(args.friends)
+    print(f"Mock LCU on {mock.protocol}://127.0.0.1:{mock.port}")
+    for key, value in mock.environ().items():
+        print(f"  {key}={value}")
+
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        mock.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,281 @@
+"""
+Benchmarks for the LCU hot paths, run against benchmarks/mock_lcu.py.
+
+    python benchmarks/run.py --latency-ms 2 --output results.json
+    python benchmarks/run.py --only lcu_request,monitor_reaction
+
+Prints one JSON document ({"meta", "results"}) so runs can be diffed or compared by a script.
+Times are in milliseconds unless the key says otherwise.
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SCRIPTS_DIR = os.path.dirname(HERE)
+sys.path.insert(0, SCRIPTS_DIR)
+sys.path.insert(0, HERE)
+
+from mock_lcu import MockLCU, action, champ_select_session  # noqa: E402
+
+
+def summarize(samples_ms):
+    """count/mean/p50/p95/p99/max of a list of millisecond samples."""
+    from Metrics import percentile
+
+    ordered = sorted(samples_ms)
+    if not ordered:
+        return {"count": 0}
+    return {
+        "count": len(ordered),
+        "mean": round(statistics.fmean(ordered), 3),
+        "p50": round(percentile(ordered, 50), 3),
+        "p95": round(percentile(ordered, 95), 3),
+        "p99": round(percentile(ordered, 99), 3),
+        "max": round(ordered[-1], 3),
+    }
+
+
+def bench_lcu_request(mock, args):
+    """Sequential latency and throughput of Rengar.lcu_request, then the same with lcu_gather."""
+    from Rengar import Rengar, POOL_SIZE
+
+    rengar = Rengar()
+    endpoint = ("GET", "/lol-summoner/v1/current-summoner", "")
+    rengar.lcu_request(*endpoint)
+
+    samples = []
+    start = time.perf_counter()
+    for _ in range(args.requests):
+        t = time.perf_counter()
+        rengar.lcu_request(*endpoint)
+        samples.append((time.perf_counter() - t) * 1000)
+    sequential_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for offset in range(0, args.requests, POOL_SIZE):
+        rengar.lcu_gather([endpoint] * min(POOL_SIZE, args.requests - offset))
+    gathered_s = time.perf_counter() - start
+
+    return {
+        "requests": args.requests,
+        "sequential": dict(summarize(samples), requests_per_s=round(args.requests / sequential_s, 1)),
+        "gather": {"batch": POOL_SIZE, "requests_per_s": round(args.requests / gathered_s, 1)},
+    }
+
+
+def bench_monitor_reaction(mock, args):
+    """Time from our champ select action going in progress to the lock PATCH reaching the client."""
+    from InstalockAutoban import InstalockAutoban
+
+    bot = InstalockAutoban()
+    if bot.registry._refresh_thread is not None:
+        bot.registry._refresh_thread.join()
+    bot.set_instalock_champion("Yasuo")
+    bot.set_auto_ban_champion("Zed")
+    bot.start_monitor()
+    if mock.websocket:
+        bot.events.wait_connected(5)
+
+    samples = {"ban": [], "pick": []}
+    for game_id in range(1, args.iterations + 1):
+        for action_type, action_id in (("ban", 1), ("pick", 2)):
+            waiting = champ_select_session(
+                [[action(1, 0, "ban")], [action(2, 0, "pick")]], game_id=game_id
+            )
+            if action_type == "pick":
+                waiting["actions"][0][0].update(championId=4, completed=True)
+            mock.set_session(waiting)
+
+            # Let the monitor see the session and plan before the turn opens
+            deadline = time.monotonic() + 5
+            while bot.tracker.session_key != (game_id, 0) and time.monotonic() < deadline:
+                time.sleep(0.005)
+            time.sleep(args.settle)
+
+            turn = json.loads(json.dumps(waiting))
+            for group in turn["actions"]:
+                for item in group:
+                    if item["id"] == action_id:
+                        item["isInProgress"] = True
+            # The turn's timer starts now, not when the waiting session was built before settle
+            turn["timer"].update(
+                internalNowInEpochMs=int(time.time() * 1000),
+                adjustedTimeLeftInPhase=turn["timer"]["totalTimeInPhase"],
+            )
+            opened = mock.set_session(turn)
+
+            locked = mock.wait_until(
+                lambda m: any(aid == action_id and change.get("completed") and t >= opened
+                              for t, aid, change in m.patches),
+                timeout=5,
+            )
+            if locked:
+                sent = next(t for t, aid, change in mock.patches
+                            if aid == action_id and change.get("completed") and t >= opened)
+                samples[action_type].append((sent - opened) * 1000)
+
+        mock.set_session(None)
+        mock.set_phase("Lobby")
+        time.sleep(args.settle)
+
+    transport = "events" if bot.events is not None and bot.events.is_connected() else "polling"
+    stages = bot.get_latency_stats()["overall"]
+    bot.stop()
+    return {
+        "transport": transport,
+        "iterations": args.iterations,
+        "ban": summarize(samples["ban"]),
+        "pick": summarize(samples["pick"]),
+        "stages": stages,
+    }
+
+
+def bench_ready_check(mock, args):
+    """Time from a ready check popping to the accept reaching the client."""
+    import threading
+    from AutoAccept import autoaccept
+
+    accepter = autoaccept()
+    accepter.auto_accept_enabled = True
+    threading.Thread(target=accepter.monitor_queue, daemon=True).start()
+    accepter_events = None
+    if mock.websocket:
+        from LCUEvents import get_event_client
+        accepter_events = get_event_client()
+        accepter_events.wait_connected(5)
+
+    samples = []
+    for _ in range(args.iterations):
+        mock.set_phase("Matchmaking")
+        time.sleep(args.settle)
+        accepted = len(mock.accepts)
+        popped = mock.start_ready_check()
+        if mock.wait_until(lambda m: len(m.accepts) > accepted, timeout=10):
+            samples.append((mock.accepts[accepted] - popped) * 1000)
+        mock.ready_check = None
+        mock.set_phase("Lobby")
+    time.sleep(args.settle)
+
+    transport = "events" if accepter_events is not None and accepter_events.is_connected() else "polling"
+    return {
+        "transport": transport,
+        "iterations": args.iterations,
+        "pop_to_accept": summarize(samples),
+        "stages": accepter.get_latency_stats()["overall"],
+    }
+
+
+def bench_remove_friends(mock, args):
+    """Wall time of api_bridge.remove_friends_func against a full friends list."""
+    import api_bridge
+
+    runs = []
+    for _ in range(args.runs):
+        mock.set_friends(args.friends)
+        start = time.perf_counter()
+        result = api_bridge.remove_friends_func()
+        runs.append((time.perf_counter() - start) * 1000)
+        if result.get("removed") != args.friends:
+            failures = result.get("failures") or [result]
+            return {"error": f"removed {result.get('removed')} of {args.friends}", "first_failure": failures[0]}
+
+    return {"friends": args.friends, "wall": summarize(runs)}
+
+
+def bench_bridge_startup(mock, args):
+    """Cold start of a fresh interpreter importing api_bridge, and of one-off CLI calls."""
+    env = dict(os.environ, **mock.environ())
+    commands = {
+        "interpreter": ["-c", "pass"],
+        "import_api_bridge": ["-c", "import api_bridge"],
+        "cli_check_client": ["api_bridge.py", "check_client"],
+        "cli_get_summoner_info": ["api_bridge.py", "get_summoner_info"],
+    }
+    samples = {name: [] for name in commands}
+    for _ in range(args.runs):
+        for name, command in commands.items():
+            start = time.perf_counter()
+            subprocess.run([sys.executable] + command, cwd=SCRIPTS_DIR, env=env,
+                           check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            samples[name].append((time.perf_counter() - start) * 1000)
+
+    return {name: summarize(values) for name, values in samples.items()}
+
+
+BENCHMARKS = {
+    "lcu_request": bench_lcu_request,
+    "monitor_reaction": bench_monitor_reaction,
+    "ready_check": bench_ready_check,
+    "remove_friends": bench_remove_friends,
+    "bridge_startup": bench_bridge_startup,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the toolkit against a mock LCU")
+    parser.add_argument("--only", help="comma separated benchmarks: " + ", ".join(BENCHMARKS))
+    parser.add_argument("--latency-ms", type=float, default=1.0, help="artificial latency per request")
+    parser.add_argument("--no-websocket", action="store_true", help="disable events, measure the polling paths")
+    parser.add_argument("--cert", help="serve https with this certificate instead of a generated one")
+    parser.add_argument("--key", help="private key for --cert")
+    parser.add_argument("--no-tls", action="store_true", help="serve plain http, skips the TLS costs")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--settle", type=float, default=0.3, help="seconds to wait between champ select steps")
+    parser.add_argument("--friends", type=int, default=200)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--output", help="write results here instead of stdout")
+    args = parser.parse_args()
+
+    selected = args.only.split(",") if args.only else list(BENCHMARKS)
+    unknown = [name for name in selected if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmark(s): {', '.join(unknown)}")
+
+    logging.basicConfig(level=logging.WARNING)
+
+    mock = MockLCU(args.latency_ms / 1000, not args.no_websocket, args.cert, args.key,
+                   tls=not args.no_tls).start()
+    # Must be set before Rengar is imported, credentials are discovered from it
+    os.environ.update(mock.environ())
+
+    results = {}
+    for name in selected:
+        start = time.perf_counter()
+        try:
+            results[name] = BENCHMARKS[name](mock, args)
+        except Exception as e:
+            results[name] = {"error": str(e)}
+        results[name]["elapsed_s"] = round(time.perf_counter() - start, 3)
+
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "protocol": mock.protocol,
+            "websocket": mock.websocket,
+            "latency_ms": args.latency_ms,
+        },
+        "results": results,
+    }
+    mock.stop()
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,50 +1,141 @@
+import threading
+import time
+import logging
+
 from Rengar import Rengar
+from LCUEvents import CHAT_SESSION_EVENT
+
+logger = logging.getLogger(__name__)
 
-rengar = Rengar()
+# Without session events a read is trusted for this long
+STATE_TTL = 5.0
+# With events the state is read again after this long anyway, in case one was missed
+PUSHED_STATE_TTL = 60.0
+# How long a suspend/resume gets to show up in the session state
+CONFIRM_TIMEOUT = 3.0
+CONFIRM_INTERVAL = 0.2
 
 
 class Chat:
-    def __init__(self):
-        self.chat_state = self.return_disconnect()
+    def __init__(self, rengar=None, ttl=STATE_TTL):
+        self.rengar = rengar or Rengar()
+        self.ttl = ttl
+        self.events = None
+
+        # Read on first use, not at construction
+        self._state = None
+        self._fetched = 0.0
+        self._changed = threading.Condition()
+        self._toggle_lock = threading.Lock()
+
+    @property
+    def chat_state(self):
+        """True when chat is disconnected"""
+        return self.return_disconnect()
+
+    def watch_events(self, events):
+        """Keep the state current from chat session events instead of reading it"""
+        self.events = events
+        events.subscribe(CHAT_SESSION_EVENT, self._on_session_event)
+
+    def _pushed(self):
+        return self.events is not None and self.events.is_connected()
+
+    def _on_session_event(self, payload):
+        data = payload.get("data")
+        # Delete events carry no data, the next call reads the session again
+        self._set_state(data.get("state") if isinstance(data, dict) else None)
+
+    def _set_state(self, state):
+        with self._changed:
+            self._state = state
+            self._fetched = time.monotonic()
+            self._changed.notify_all()
+
+    def _read_state(self):
+        try:
+            req = self.rengar.lcu_request("GET", "/chat/v1/session", "")
+            state = req.json().get("state") if req.status_code == 200 else None
+        except Exception as e:
+            logger.debug(f"Could not read chat session: {e}")
+            state = None
+        self._set_state(state)
+        return state
+
+    def session_state(self, refresh=False):
+        """Chat session state ("connected", "disconnected", ...), None if the client can't be reached"""
+        with self._changed:
+            ttl = PUSHED_STATE_TTL if self._pushed() else self.ttl
+            fresh = self._state is not None and time.monotonic() - self._fetched < ttl
+            if fresh and not refresh:
+                return self._state
+        return self._read_state()
 
     def return_disconnect(self):
         """Check if chat is currently disconnected"""
-        try:
-            req = rengar.lcu_request("GET", "/chat/v1/session", "")
-            if req.status_code == 200:
-                req_data = req.json()
-                return req_data.get("state") == "disconnected"
-            return False
-        except Exception:
-            return False
+        return self.session_state() == "disconnected"
+
+    def _confirm(self, disconnected):
+        """Wait until the client reports the state a suspend/resume asked for"""
+        def reached():
+            return self._state is not None and (self._state == "disconnected") == disconnected
+
+        deadline = time.monotonic() + CONFIRM_TIMEOUT
+        while True:
+            if self._pushed():
+                with self._changed:
+                    if self._changed.wait_for(reached, CONFIRM_INTERVAL):
+                        return True
+            else:
+                self._read_state()
+                if reached():
+                    return True
+                time.sleep(CONFIRM_INTERVAL)
+
+            if time.monotonic() >= deadline:
+                # A missed event must not turn a working suspend/resume into a failure
+                self._read_state()
+                if reached():
+                    return True
+                logger.warning(f"Chat did not {'disconnect' if disconnected else 'reconnect'} in {CONFIRM_TIMEOUT}s")
+                return False
 
     def disconnect(self):
-        """Disconnect from chat"""
-        try:
-            body = {"config": "disable"}
-            response = rengar.lcu_request("POST", "/chat/v1/suspend", body)
-            return response.status_code in [200, 204]
-        except Exception as e:
-            print(f"Error disconnecting chat: {e}")
-            return False
+        """Disconnect from chat, no-op if already disconnected"""
+        with self._toggle_lock:
+            if self.session_state() == "disconnected":
+                return True
+            try:
+                body = {"config": "disable"}
+                response = self.rengar.lcu_request("POST", "/chat/v1/suspend", body)
+            except Exception as e:
+                logger.error(f"Error disconnecting chat: {e}")
+                return False
+            if response.status_code not in [200, 204]:
+                return False
+            return self._confirm(True)
 
     def reconnect(self):
-        """Reconnect to chat"""
-        try:
-            response = rengar.lcu_request("POST", "/chat/v1/resume", "")
-            return response.status_code in [200, 204]
-        except Exception as e:
-            print(f"Error reconnecting chat: {e}")
-            return False
+        """Reconnect to chat, no-op if already connected"""
+        with self._toggle_lock:
+            state = self.session_state()
+            if state is not None and state != "disconnected":
+                return True
+            try:
+                response = self.rengar.lcu_request("POST", "/chat/v1/resume", "")
+            except Exception as e:
+                logger.error(f"Error reconnecting chat: {e}")
+                return False
+            if response.status_code not in [200, 204]:
+                return False
+            return self._confirm(False)
 
     def toggle_chat(self):
-        """Toggle chat state"""
-        self.chat_state = not self.chat_state
-        if self.chat_state:
-            return self.disconnect()
-        else:
+        """Toggle chat state based on what the client reports"""
+        if self.return_disconnect():
             return self.reconnect()
+        return self.disconnect()
 
     def return_state(self):
         """Return current chat state as string"""
-        return "OFF" if self.chat_state else "ON"
\ No newline at end of file
+        return "OFF" if self.chat_state else "ON"
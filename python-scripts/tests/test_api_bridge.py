@@ -0,0 +1,141 @@
+"""
+Method registry and JSON-RPC dispatch shared by every api_bridge transport.
+
+    python -m pytest tests
+"""
+
+import json
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import api_bridge  # noqa: E402
+from api_bridge import REQUIRED, BridgeMethod, InvalidParams, Param  # noqa: E402
+
+
+def echo(count, name, flag):
+    return {"count": count, "name": name, "flag": flag}
+
+
+def fail():
+    raise RuntimeError("boom")
+
+
+ECHO = BridgeMethod("test_echo", echo, (
+    Param("count", int, REQUIRED), Param("name", str, "x"), Param("flag", bool, False),
+))
+
+
+class ParamTest(unittest.TestCase):
+    def test_converts_cli_strings(self):
+        self.assertEqual(Param("n", int).convert("5"), 5)
+        self.assertEqual(Param("f", float).convert("1.5"), 1.5)
+        self.assertIs(Param("b", bool).convert("true"), True)
+        self.assertIs(Param("b", bool).convert("False"), False)
+        self.assertIs(Param("b", bool).convert(True), True)
+
+    def test_missing_value_uses_default(self):
+        self.assertEqual(Param("name", str, "x").convert(None), "x")
+        self.assertEqual(Param("name", str, "x").convert(""), "x")
+
+    def test_required(self):
+        with self.assertRaisesRegex(InvalidParams, "icon_id is required"):
+            Param("icon_id", int, REQUIRED).convert(None)
+
+    def test_type_error(self):
+        with self.assertRaisesRegex(InvalidParams, "icon_id must be int, got 'abc'"):
+            Param("icon_id", int).convert("abc")
+
+
+class BindTest(unittest.TestCase):
+    def test_positional(self):
+        self.assertEqual(ECHO.bind(["3", "y"]), {"count": 3, "name": "y", "flag": False})
+
+    def test_named(self):
+        self.assertEqual(ECHO.bind({"flag": "true", "count": 1}), {"count": 1, "name": "x", "flag": True})
+
+    def test_too_many_positional(self):
+        with self.assertRaisesRegex(InvalidParams, "at most 3 params, got 4"):
+            ECHO.bind([1, 2, 3, 4])
+
+    def test_unknown_named(self):
+        with self.assertRaisesRegex(InvalidParams, "unknown params for test_echo: other"):
+            ECHO.bind({"count": 1, "other": 2})
+
+    def test_missing_required(self):
+        with self.assertRaisesRegex(InvalidParams, "count is required"):
+            ECHO.bind(None)
+
+    def test_params_must_be_list_or_object(self):
+        with self.assertRaisesRegex(InvalidParams, "list or an object"):
+            ECHO.bind("count")
+
+
+class DispatchTest(unittest.TestCase):
+    def setUp(self):
+        api_bridge.METHODS["test_echo"] = ECHO
+        api_bridge.bridge_method("test_fail")(fail)
+        self.addCleanup(api_bridge.METHODS.pop, "test_echo")
+        self.addCleanup(api_bridge.METHODS.pop, "test_fail")
+
+    def rpc(self, request):
+        return api_bridge.handle_rpc_line(json.dumps(request))
+
+    def error_code(self, response):
+        return response["error"]["code"]
+
+    def test_result(self):
+        response = self.rpc({"jsonrpc": "2.0", "id": 7, "method": "test_echo", "params": {"count": 2}})
+        self.assertEqual(response, {"jsonrpc": "2.0", "id": 7, "result": {"count": 2, "name": "x", "flag": False}})
+
+    def test_error_codes(self):
+        self.assertEqual(self.error_code(api_bridge.handle_rpc_line("{nope")), api_bridge.PARSE_ERROR)
+        self.assertEqual(self.error_code(self.rpc({"id": 1})), api_bridge.INVALID_REQUEST)
+        self.assertEqual(self.error_code(self.rpc([])), api_bridge.INVALID_REQUEST)
+        self.assertEqual(self.error_code(self.rpc({"id": 1, "method": "missing"})), api_bridge.METHOD_NOT_FOUND)
+        self.assertEqual(self.error_code(self.rpc({"id": 1, "method": "test_echo", "params": ["a"]})),
+                         api_bridge.INVALID_PARAMS)
+        self.assertEqual(self.error_code(self.rpc({"id": 1, "method": "test_fail"})), api_bridge.INTERNAL_ERROR)
+
+    def test_error_keeps_request_id(self):
+        self.assertEqual(self.rpc({"id": "abc", "method": "missing"})["id"], "abc")
+
+    def test_batch_answers_in_request_order(self):
+        responses = self.rpc([
+            {"jsonrpc": "2.0", "id": 1, "method": "test_echo", "params": [1]},
+            {"jsonrpc": "2.0", "id": 2, "method": "missing"},
+            {"jsonrpc": "2.0", "id": 3, "method": "test_echo", "params": [3]},
+        ])
+        self.assertEqual([r["id"] for r in responses], [1, 2, 3])
+        self.assertEqual(responses[0]["result"]["count"], 1)
+        self.assertEqual(self.error_code(responses[1]), api_bridge.METHOD_NOT_FOUND)
+        self.assertEqual(responses[2]["result"]["count"], 3)
+
+    def test_notifications_get_no_response(self):
+        self.assertIsNone(self.rpc({"jsonrpc": "2.0", "method": "test_echo", "params": [1]}))
+        self.assertIsNone(self.rpc([{"jsonrpc": "2.0", "method": "test_echo", "params": [1]}]))
+        responses = self.rpc([
+            {"jsonrpc": "2.0", "method": "test_echo", "params": [1]},
+            {"jsonrpc": "2.0", "id": 2, "method": "test_echo", "params": [2]},
+        ])
+        self.assertEqual([r["id"] for r in responses], [2])
+
+    def test_call_batch_order_and_forms(self):
+        results = api_bridge.call_batch([
+            ["test_echo", "1"],
+            {"method": "test_echo", "params": {"count": 2, "name": "y"}},
+            ["missing"],
+            "bad",
+            ["test_echo"],
+        ])
+        self.assertEqual(results[0], {"count": 1, "name": "x", "flag": False})
+        self.assertEqual(results[1], {"count": 2, "name": "y", "flag": False})
+        self.assertEqual(results[2], {"success": False, "error": "Unknown method: missing"})
+        self.assertEqual(results[3], {"success": False, "error": "Invalid call: 'bad'"})
+        self.assertEqual(results[4], {"success": False, "error": "count is required"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+"""
+Champion select monitor against benchmarks/mock_lcu.py.
+
+    python -m pytest tests
+"""
+
+import os
+import sys
+import unittest
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SCRIPTS_DIR = os.path.dirname(HERE)
+sys.path.insert(0, SCRIPTS_DIR)
+sys.path.insert(0, os.path.join(SCRIPTS_DIR, "benchmarks"))
+
+from mock_lcu import MockLCU, action, champ_select_session  # noqa: E402
+
+YASUO, AHRI = 2, 5
+
+
+class PendingTurnTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.mock = MockLCU(latency=0.001, websocket=False).start()
+        # Must be set before Rengar is imported, credentials are discovered from it
+        os.environ.update(cls.mock.environ())
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.mock.stop()
+
+    def setUp(self):
+        from InstalockAutoban import InstalockAutoban
+
+        self.bot = InstalockAutoban()
+        if self.bot.registry._refresh_thread is not None:
+            self.bot.registry._refresh_thread.join()
+        self.addCleanup(self.bot.stop)
+
+    def locked(self, action_id, champion_id, timeout):
+        return self.mock.wait_until(
+            lambda m: any(aid == action_id and change.get("completed") and change.get("championId") == champion_id
+                          for _, aid, change in m.patches),
+            timeout=timeout,
+        )
+
+    def test_pick_without_candidate_locks_after_config_update(self):
+        self.bot.set_instalock_champion("Yasuo")
+        self.bot.start_monitor()
+
+        # Yasuo is already banned when our pick turn opens, so there is nothing to lock
+        self.mock.set_session(champ_select_session([
+            [action(1, 5, "ban", YASUO, completed=True)],
+            [action(2, 0, "pick", in_progress=True)],
+        ]))
+        self.assertFalse(self.locked(2, YASUO, timeout=1.5))
+
+        # The turn stays pending, so the new choice is locked without any session change
+        self.bot.set_instalock_champion("Ahri")
+        self.assertTrue(self.locked(2, AHRI, timeout=5))
+
+    def test_pick_in_progress_locks_without_hovering_first(self):
+        self.bot.set_instalock_champion("Ahri")
+        self.bot.start_monitor()
+
+        # Blind pick: the first snapshot already has our pick in progress
+        self.mock.set_session(champ_select_session([[action(1, 0, "pick", in_progress=True)]]))
+        self.assertTrue(self.locked(1, AHRI, timeout=5))
+        self.assertEqual([change for _, aid, change in self.mock.patches if aid == 1],
+                         [{"completed": True, "championId": AHRI}])
+
+
+if __name__ == "__main__":
+    unittest.main()